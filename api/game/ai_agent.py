@@ -1,26 +1,90 @@
 """AI agent for playing backgammon."""
 
+import heapq
+import math
+import multiprocessing
+import pickle
 import random
-from typing import List, Optional
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from .engine import GameEngine
 from .move import Move, MoveType
 from .board import PlayerColor
 
 
+# Free-threaded builds (no GIL) run searches in parallel threads, which
+# avoids starting processes; otherwise threads would just take turns
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Worker pool shared by root-parallel searches, created on first use with
+# the worker count of the first search and kept for the process lifetime
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+# Pool processes are started by a forkserver: the first search runs in a
+# request thread, and forking a multithreaded process can copy held locks
+_SEARCH_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _get_executor(workers: int) -> Executor:
+    """Get the shared search worker pool, creating it with the given size."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            if FREE_THREADED:
+                _executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                _executor = ProcessPoolExecutor(max_workers=workers, mp_context=_SEARCH_MP_CONTEXT)
+        return _executor
+
+
+def _score_root_moves(agent: 'AIAgent', engine: GameEngine, moves: List[Move], depth: int) -> List[float]:
+    """Score root moves with a full search window (runs in a worker process)."""
+    return [agent._search_move(engine, move, depth, -math.inf, math.inf) for move in moves]
+
+
 class AIAgent:
-    """Simple AI agent that evaluates moves and selects the best one."""
+    """AI agent that evaluates moves and selects the best one.
+
+    The "hard" difficulty looks ahead with a depth-limited negamax search
+    (alpha-beta pruning, iterative deepening) over the remaining moves of
+    the turn.
+    """
+
+    # Search depth (in single-die moves) used by the "hard" difficulty
+    SEARCH_DEPTH = 2
+
+    # Score assigned to won/lost positions
+    WIN_SCORE = 100000.0
+
+    # Transposition table entry flags: exact score, lower bound, upper bound
+    TT_EXACT = 0
+    TT_LOWER = 1
+    TT_UPPER = 2
     
-    def __init__(self, difficulty: str = "medium"):
+    def __init__(self, difficulty: str = "medium", workers: int = 1, seed: Optional[int] = None):
         """
         Args:
             difficulty: "easy", "medium", or "hard"
+            workers: Processes used to search root moves in parallel ("hard" only)
+            seed: Seed for the agent's random choices (None for nondeterministic play)
         """
         self.difficulty = difficulty
+        self.workers = workers
+        self._rng = random.Random(seed)
         self.difficulty_weights = {
             "easy": {"random": 0.7, "greedy": 0.3},
             "medium": {"random": 0.3, "greedy": 0.7},
             "hard": {"random": 0.1, "greedy": 0.9}
         }
+        # Killer move per remaining search depth (last move that caused a cutoff)
+        self._killers: Dict[int, Move] = {}
+        # Transposition table: (board hash, player, dice state) -> (depth, score, move, flag)
+        self._tt: Dict[Tuple, Tuple[int, float, Optional[Move], int]] = {}
     
     def select_move(self, engine: GameEngine) -> Optional[Move]:
         """Select the best move from legal moves.
@@ -31,73 +95,286 @@ class AIAgent:
         Returns:
             Selected move or None if no moves available
         """
-        legal_moves = engine.get_legal_moves()
+        legal_moves = engine.get_distinct_legal_moves()
         if not legal_moves:
             return None
         
         # Easy: mostly random
         if self.difficulty == "easy":
-            return random.choice(legal_moves)
+            return self._rng.choice(legal_moves)
         
         # Medium/Hard: evaluate moves
-        scored_moves = [(move, self._evaluate_move(engine, move)) for move in legal_moves]
-        scored_moves.sort(key=lambda x: x[1], reverse=True)
-        
-        # Medium: sometimes pick random from top 3
-        if self.difficulty == "medium" and random.random() < 0.3:
-            top_moves = scored_moves[:min(3, len(scored_moves))]
-            return random.choice(top_moves)[0]
+        scored_moves = list(zip(legal_moves, self._evaluate_moves(engine, legal_moves)))
+
+        # Medium: sometimes pick random from top 3, otherwise the best scored move
+        if self.difficulty == "medium":
+            if self._rng.random() < 0.3:
+                top_moves = heapq.nlargest(3, scored_moves, key=itemgetter(1))
+                return self._rng.choice(top_moves)[0]
+            return max(scored_moves, key=itemgetter(1))[0]
         
-        # Hard: always pick best
-        return scored_moves[0][0]
+        # Hard: search ahead for the best move of the turn. The search plays
+        # moves in place, so it runs on a copy: the game itself stays readable
+        # by other requests meanwhile
+        self._killers = {}
+        self._tt = {}
+        engine = engine.copy()
+        if self.workers > 1 and len(legal_moves) > 1:
+            scored_moves.sort(key=itemgetter(1), reverse=True)
+            root_moves = [move for move, _ in scored_moves]
+            # The shallower iterations are cheap: run them here and search
+            # their best move first, as the serial search does
+            shallow_best = self._iterative_deepening(engine, self.SEARCH_DEPTH - 1)
+            if shallow_best is not None:
+                root_moves.remove(shallow_best)
+                root_moves.insert(0, shallow_best)
+            return self._parallel_root_search(engine, root_moves)
+        return self._iterative_deepening(engine, self.SEARCH_DEPTH) or max(scored_moves, key=itemgetter(1))[0]
+
+    def _iterative_deepening(self, engine: GameEngine, max_depth: int) -> Optional[Move]:
+        """Search with increasing depth up to max_depth.
+
+        Each iteration leaves its best moves in the transposition table, so
+        the next, deeper iteration searches them first and prunes more.
+        """
+        best_move = None
+        for depth in range(1, max_depth + 1):
+            _, move = self._negamax(engine, depth, -math.inf, math.inf)
+            if move is not None:
+                best_move = move
+        return best_move
+
+    def _parallel_root_search(self, engine: GameEngine, root_moves: List[Move]) -> Move:
+        """Search root moves split across workers and pick the best.
+
+        Each worker searches its share of root moves independently on its own
+        copy of the agent and engine; ties go to the earliest move in
+        root_moves, matching the serial search.
+        """
+        executor = _get_executor(self.workers)
+        chunks = [root_moves[i::self.workers] for i in range(self.workers)]
+        futures = []
+        for chunk in chunks:
+            if not chunk:
+                continue
+            # Process workers get copies by pickling; threads need them made here
+            agent, search_engine = (
+                pickle.loads(pickle.dumps((self, engine))) if FREE_THREADED else (self, engine)
+            )
+            futures.append(executor.submit(_score_root_moves, agent, search_engine, chunk, self.SEARCH_DEPTH))
+
+        scores: Dict[Move, float] = {}
+        for chunk, future in zip(chunks, futures):
+            scores.update(zip(chunk, future.result()))
+        return max(root_moves, key=lambda m: scores[m])
+
+    def _negamax(self, engine: GameEngine, depth: int, alpha: float, beta: float) -> Tuple[float, Optional[Move]]:
+        """Depth-limited negamax search with alpha-beta pruning.
+
+        Scores are from the perspective of the current player. Consecutive
+        moves of the same turn keep the sign; the sign flips when the turn
+        passes to the opponent.
+
+        Args:
+            engine: GameEngine instance (restored to its original state on return)
+            depth: Remaining search depth
+            alpha: Lower bound of the search window
+            beta: Upper bound of the search window
+
+        Returns:
+            Tuple of (score, best move or None at leaf nodes)
+        """
+        color = engine.current_player
+        if depth <= 0 or engine.game_over or color is None:
+            return self._evaluate_position(engine, color), None
+
+        legal_moves = engine.get_distinct_legal_moves()
+        if not legal_moves:
+            return self._evaluate_position(engine, color), None
+
+        # The same position is often reached by playing the dice in a different order
+        tt_key = (engine.board.zobrist_hash, color, engine.get_dice_state())
+        entry = self._tt.get(tt_key)
+        tt_move = None
+        if entry is not None:
+            tt_depth, tt_score, tt_move, tt_flag = entry
+            if tt_depth >= depth:
+                if tt_flag == self.TT_EXACT:
+                    return tt_score, tt_move
+                if tt_flag == self.TT_LOWER:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if alpha >= beta:
+                    return tt_score, tt_move
+        alpha_orig = alpha
+
+        # Move ordering: stored best move, then killer move, then by heuristic score
+        scored_moves = sorted(
+            zip(legal_moves, self._evaluate_moves(engine, legal_moves)),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        legal_moves = [move for move, _ in scored_moves]
+        killer = self._killers.get(depth)
+        for first in (killer, tt_move):
+            if first is not None and first in legal_moves:
+                legal_moves.remove(first)
+                legal_moves.insert(0, first)
+
+        best_score = -math.inf
+        best_move = None
+        for move in legal_moves:
+            score = self._search_move(engine, move, depth, alpha, beta)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self._killers[depth] = move
+                break
+
+        if best_score <= alpha_orig:
+            flag = self.TT_UPPER
+        elif best_score >= beta:
+            flag = self.TT_LOWER
+        else:
+            flag = self.TT_EXACT
+        self._tt[tt_key] = (depth, best_score, best_move, flag)
+        return best_score, best_move
+
+    def _search_move(self, engine: GameEngine, move: Move, depth: int, alpha: float, beta: float) -> float:
+        """Play a move, search the resulting position and undo the move.
+
+        Returns:
+            Score of the move from the perspective of the player making it
+        """
+        snapshot = self._snapshot(engine)
+        try:
+            engine.make_move_trusted(move)
+
+            if self._turn_continues(engine):
+                score, _ = self._negamax(engine, depth - 1, alpha, beta)
+            else:
+                engine.switch_player()
+                score, _ = self._negamax(engine, depth - 1, -beta, -alpha)
+                score = -score
+        finally:
+            self._restore(engine, snapshot)
+        return score
+
+    def _turn_continues(self, engine: GameEngine) -> bool:
+        """Check if the current player still has moves to play this turn."""
+        if engine.game_over or not engine.has_remaining_moves():
+            return False
+        return bool(engine.get_legal_moves())
+
+    def _snapshot(self, engine: GameEngine) -> Tuple:
+        """Capture the engine state mutated by make_move/switch_player."""
+        return (
+            engine.board.checkpoint(),
+            engine.current_player,
+            engine.get_dice_state(),
+            engine.game_over,
+            engine.winner,
+        )
+
+    def _restore(self, engine: GameEngine, snapshot: Tuple):
+        """Restore engine state captured by _snapshot."""
+        board_token, player, dice_state, game_over, winner = snapshot
+        engine.board.rollback(board_token)
+        engine.current_player = player
+        engine.set_dice_state(dice_state)
+        engine.game_over = game_over
+        engine.winner = winner
+
+    def _evaluate_position(self, engine: GameEngine, color: Optional[PlayerColor]) -> float:
+        """Evaluate the board from the perspective of the given color.
+
+        Higher score = better position.
+
+        Args:
+            engine: GameEngine instance
+            color: Player to evaluate for
+
+        Returns:
+            Score for the position
+        """
+        if color is None:
+            return 0.0
+        if engine.winner is not None:
+            return self.WIN_SCORE if engine.winner == color else -self.WIN_SCORE
+
+        opponent = color.opposite()
+        return self._side_score(engine, color) - self._side_score(engine, opponent)
+
+    def _side_score(self, engine: GameEngine, color: PlayerColor) -> float:
+        """Score one side of the board (race progress, safety and bar)."""
+        board = engine.board
+        opponent = color.opposite()
+        can_hit = engine.rules.can_hit()
+
+        own = board.counts[color.idx]
+        opp = board.counts[opponent.idx]
+
+        pips = board.get_bar_count(color) * 25
+        score = board.borne_off[color.idx] * 15.0 - board.get_bar_count(color) * 20.0
+        for point_num in range(1, board.num_points + 1):
+            count = own[point_num]
+            if count == 0:
+                continue
+            pips += engine._bearing_distance(color, point_num) * count
+            if count >= 2:
+                # Made points are safe and block the opponent
+                score += 5.0
+            elif can_hit and opp[point_num] == 0:
+                # Exposed blot
+                score -= 8.0
+
+        return score - pips
     
-    def _evaluate_move(self, engine: GameEngine, move: Move) -> float:
-        """Evaluate a move and return a score.
-        
-        Higher score = better move.
-        
+    def _evaluate_moves(self, engine: GameEngine, moves: List[Move]) -> List[float]:
+        """Score a batch of candidate moves of the current player.
+
+        Higher score = better move. Board rows, the hit rule and the
+        progress direction are looked up once for the whole batch.
+
         Args:
             engine: GameEngine instance
-            move: Move to evaluate
-            
+            moves: Moves of one color from the current position
+
         Returns:
-            Score for the move
+            Scores in the same order as moves
         """
-        score = 0.0
+        if not moves:
+            return []
+
+        color = moves[0].color
         board = engine.board
-        color = move.color
-        
-        # Priority 1: Bear off (winning move)
-        if move.move_type == MoveType.BEAR_OFF:
-            score += 1000
-        
-        # Priority 2: Enter from bar
-        if move.move_type == MoveType.ENTER:
-            score += 500
-        
-        # Priority 3: Hit opponent (if allowed)
-        if move.move_type == MoveType.NORMAL and move.to_point:
-            target_point = board.get_point(move.to_point)
-            opponent = color.opposite()
-            if target_point.is_blot(opponent) and engine.rules.can_hit():
-                score += 300
-        
-        # Priority 4: Move pieces forward (toward bearing off)
-        if move.move_type == MoveType.NORMAL:
-            # Calculate progress toward bearing off
-            if color == PlayerColor.WHITE:
-                progress = (move.from_point - move.to_point) if move.to_point else 0
+        own = board.counts[color.idx]
+        opp = board.counts[color.opp_idx]
+        can_hit = engine.rules.can_hit()
+        progress_weight = 10 if color is PlayerColor.WHITE else -10
+
+        scores = []
+        for move in moves:
+            move_type = move.move_type
+            to_point = move.to_point
+            if move_type is MoveType.NORMAL:
+                # Hits, progress toward bearing off and new safe points
+                score = 0.0
+                if to_point:
+                    score += (move.from_point - to_point) * progress_weight
+                    if can_hit and opp[to_point] == 1:
+                        score += 300
+                    if own[to_point] == 1:
+                        score += 50
+            elif move_type is MoveType.BEAR_OFF:
+                # Bearing off is the winning move
+                score = 1000.0
             else:
-                progress = (move.to_point - move.from_point) if move.to_point else 0
-            score += progress * 10
-        
-        # Priority 5: Create safe points (points with 2+ pieces)
-        if move.move_type == MoveType.NORMAL and move.to_point:
-            target_point = board.get_point(move.to_point)
-            if target_point.get_pieces(color) == 1:  # Will have 2 after move
-                score += 50
-        
-        # Priority 6: Use higher dice values (more progress)
-        score += move.die_value * 5
-        
-        return score
+                # Entering from the bar comes before any other move
+                score = 500.0
+            scores.append(score + move.die_value * 5)
+        return scores
@@ -1,42 +1,91 @@
 """Board representation for backgammon games."""
 
+import random
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
 
 
 class PlayerColor(Enum):
     """Player colors in backgammon."""
-    WHITE = "white"
-    BLACK = "black"
+    WHITE = ("white", 0)
+    BLACK = ("black", 1)
+
+    def __new__(cls, value: str, idx: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        # Integer index used to address per-color board storage
+        member.idx = idx
+        return member
     
     def opposite(self):
         """Get the opposite color."""
-        return PlayerColor.BLACK if self == PlayerColor.WHITE else PlayerColor.WHITE
+        return self._opposite
+
+
+# Opposite colors are resolved once here so opposite() is a plain attribute read;
+# opp_idx is the opponent's storage index, for hot paths that only need that
+PlayerColor.WHITE._opposite = PlayerColor.BLACK
+PlayerColor.BLACK._opposite = PlayerColor.WHITE
+PlayerColor.WHITE.opp_idx = PlayerColor.BLACK.idx
+PlayerColor.BLACK.opp_idx = PlayerColor.WHITE.idx
+
+
+# Zobrist keys for incremental board hashing, indexed by [color idx][slot][count].
+# Slot 0 is the bar, slots 1-24 are points and slot 25 counts borne off pieces.
+# Count 0 maps to 0 so an empty board hashes to 0.
+ZOBRIST_SLOTS = 26
+ZOBRIST_MAX_COUNT = 32
+_zobrist_rng = random.Random(0x7AB1A)
+ZOBRIST: List[List[List[int]]] = [
+    [
+        [0] + [_zobrist_rng.getrandbits(64) for _ in range(ZOBRIST_MAX_COUNT)]
+        for _ in range(ZOBRIST_SLOTS)
+    ]
+    for _ in PlayerColor
+]
+
+# Horizontal rules of the text board
+_BORDER = "=" * 50
+_SEPARATOR = "-" * 50
+
+
+@lru_cache(maxsize=None)
+def _bearing_distances(num_points: int, low_end: bool) -> Tuple[int, ...]:
+    """Bearing distance of every point for a color bearing off at the low or high end."""
+    if low_end:
+        return tuple(range(num_points + 1))
+    return tuple(num_points + 1 - p for p in range(num_points + 1))
 
 
-@dataclass
 class Point:
-    """Represents a point on the board."""
-    number: int  # 1-24, where 1 is black's home, 24 is white's home
-    pieces: Dict[PlayerColor, int]  # Number of pieces of each color
-    
-    def __post_init__(self):
-        if self.pieces is None:
-            self.pieces = {PlayerColor.WHITE: 0, PlayerColor.BLACK: 0}
+    """View of a single point on the board.
+
+    Piece counts are stored in the owning board's per-color count arrays.
+    """
+
+    __slots__ = ("number", "board")
+
+    def __init__(self, number: int, board: 'Board'):
+        self.number = number  # 1-24, where 1 is black's home, 24 is white's home
+        self.board = board
+
+    @property
+    def pieces(self) -> Dict[PlayerColor, int]:
+        """Number of pieces of each color."""
+        return {color: self.board.counts[color.idx][self.number] for color in PlayerColor}
     
     def get_pieces(self, color: PlayerColor) -> int:
         """Get number of pieces of given color on this point."""
-        return self.pieces.get(color, 0)
+        return self.board.counts[color.idx][self.number]
     
     def is_blocked(self, color: PlayerColor) -> bool:
         """Check if point is blocked for given color (2+ opponent pieces)."""
-        opponent = color.opposite()
-        return self.get_pieces(opponent) >= 2
+        return (self.board.ge2[color._opposite.idx] >> self.number) & 1 == 1
     
     def is_blot(self, color: PlayerColor) -> bool:
         """Check if point has a blot (single piece) of given color."""
-        return self.get_pieces(color) == 1
+        return self.board.counts[color.idx][self.number] == 1
     
     def can_land(self, color: PlayerColor) -> bool:
         """Check if a piece of given color can land on this point."""
@@ -52,34 +101,118 @@ class Point:
     
     def add_piece(self, color: PlayerColor, count: int = 1):
         """Add pieces to this point."""
-        self.pieces[color] = self.pieces.get(color, 0) + count
+        self.board.add_piece(color, self.number, count)
     
     def remove_piece(self, color: PlayerColor, count: int = 1):
         """Remove pieces from this point."""
-        current = self.pieces.get(color, 0)
-        self.pieces[color] = max(0, current - count)
+        self.board.remove_piece(color, self.number, count)
+
+    def __repr__(self) -> str:
+        return f"Point(number={self.number}, pieces={self.pieces})"
 
 
 class Board:
-    """Represents the backgammon board state."""
+    """Represents the backgammon board state.
+
+    Piece counts are stored as one list per color (``counts[color.idx][point]``,
+    index 0 unused) rather than as per-point objects, so hot loops can index
+    plain lists; ``get_point`` returns a ``Point`` view over them. The views
+    are only created when first asked for.
+    """
     
     def __init__(self, num_points: int = 24, rules=None):
         """Initialize board with given number of points."""
         self.num_points = num_points
-        self.points: Dict[int, Point] = {}
-        self.bar: Dict[PlayerColor, int] = {
-            PlayerColor.WHITE: 0,
-            PlayerColor.BLACK: 0
-        }
-        self.borne_off: Dict[PlayerColor, int] = {
-            PlayerColor.WHITE: 0,
-            PlayerColor.BLACK: 0
-        }
+        self.counts: List[List[int]] = [[0] * (num_points + 1) for _ in PlayerColor]
+        self._points: Optional[Dict[int, Point]] = None
+        # Pieces on the bar and borne off, per color index
+        self.bar: List[int] = [0] * len(PlayerColor)
+        self.borne_off: List[int] = [0] * len(PlayerColor)
         self.rules = rules
-        
-        # Initialize all points
-        for i in range(1, num_points + 1):
-            self.points[i] = Point(i, {PlayerColor.WHITE: 0, PlayerColor.BLACK: 0})
+        # Zobrist hash of the position, updated incrementally on every change
+        self.zobrist_hash = 0
+        # Home range, per-point bearing distance and the highest bearing
+        # distance among occupied home points, per color index
+        self.home_range: List[Tuple[int, int]] = [self._compute_bearing_off_point(c) for c in PlayerColor]
+        self.bear_dist: List[Tuple[int, ...]] = [
+            _bearing_distances(num_points, home[0] == 1) for home in self.home_range
+        ]
+        self.max_bear_dist: List[int] = [0] * len(PlayerColor)
+        # Point bitboards per color index: bit p is set when point p holds
+        # at least one (occ) or at least two (ge2) pieces of that color
+        self.occ: List[int] = [0] * len(PlayerColor)
+        self.ge2: List[int] = [0] * len(PlayerColor)
+        # Bitboard of the points outside each color's home board
+        all_points = (1 << (num_points + 1)) - 2
+        self.outside_home: List[int] = [
+            all_points & ~(((1 << (end + 1)) - 1) ^ ((1 << start) - 1)) for start, end in self.home_range
+        ]
+        # Slot changes since the outermost open checkpoint, as
+        # (color index, slot, old count); None when no checkpoint is open
+        self._journal: Optional[List[Tuple[int, int, int]]] = None
+        # Number of open checkpoints; the journal is dropped when it reaches 0
+        self._journal_depth = 0
+    
+    @property
+    def points(self) -> Dict[int, Point]:
+        """Point views by number."""
+        if self._points is None:
+            self._points = {i: Point(i, self) for i in range(1, self.num_points + 1)}
+        return self._points
+    
+    def _update_hash(self, color: PlayerColor, slot: int, old_count: int, new_count: int):
+        """Update the Zobrist hash for a piece count change on a slot."""
+        idx = color.idx
+        keys = ZOBRIST[idx][slot]
+        self.zobrist_hash ^= keys[old_count] ^ keys[new_count]
+        if self._journal is not None:
+            self._journal.append((idx, slot, old_count))
+
+    def _update_masks(self, idx: int, point_num: int, new_count: int):
+        """Update the occupancy bitboards after a piece count change on a point."""
+        bit = 1 << point_num
+        if new_count >= 2:
+            self.occ[idx] |= bit
+            self.ge2[idx] |= bit
+        elif new_count == 1:
+            self.occ[idx] |= bit
+            self.ge2[idx] &= ~bit
+        else:
+            self.occ[idx] &= ~bit
+            self.ge2[idx] &= ~bit
+    
+    def add_piece(self, color: PlayerColor, point_num: int, count: int = 1):
+        """Add pieces of given color to a point."""
+        row = self.counts[color.idx]
+        current = row[point_num]
+        row[point_num] = current + count
+        self._update_hash(color, point_num, current, current + count)
+
+        idx = color.idx
+        self._update_masks(idx, point_num, row[point_num])
+        home_start, home_end = self.home_range[idx]
+        if count > 0 and home_start <= point_num <= home_end:
+            distance = self.bear_dist[idx][point_num]
+            if distance > self.max_bear_dist[idx]:
+                self.max_bear_dist[idx] = distance
+    
+    def remove_piece(self, color: PlayerColor, point_num: int, count: int = 1):
+        """Remove pieces of given color from a point."""
+        row = self.counts[color.idx]
+        current = row[point_num]
+        row[point_num] = max(0, current - count)
+        self._update_hash(color, point_num, current, row[point_num])
+
+        idx = color.idx
+        self._update_masks(idx, point_num, row[point_num])
+        if current > 0 and row[point_num] == 0 and self.bear_dist[idx][point_num] == self.max_bear_dist[idx]:
+            home_start, home_end = self.home_range[idx]
+            if home_start <= point_num <= home_end:
+                distances = self.bear_dist[idx]
+                self.max_bear_dist[idx] = max(
+                    (distances[p] for p in range(home_start, home_end + 1) if row[p] > 0),
+                    default=0,
+                )
     
     def setup_initial(self, setup: Dict[PlayerColor, Dict[int, int]]):
         """Set up initial board configuration.
@@ -87,10 +220,93 @@ class Board:
         Args:
             setup: Dict mapping color to dict of {point_number: piece_count}
         """
+        # Write the counts directly and derive hash and bitboards once
         for color, positions in setup.items():
+            row = self.counts[color.idx]
             for point_num, count in positions.items():
                 if 1 <= point_num <= self.num_points:
-                    self.points[point_num].add_piece(color, count)
+                    row[point_num] += count
+        self._rebuild_derived()
+    
+    def _rebuild_derived(self):
+        """Recompute the hash, bitboards and max bearing distance from the counts."""
+        borne_off_slot = self.num_points + 1
+        zobrist_hash = 0
+        for idx, row in enumerate(self.counts):
+            keys = ZOBRIST[idx]
+            occ = ge2 = 0
+            for point_num in range(1, self.num_points + 1):
+                count = row[point_num]
+                if count:
+                    zobrist_hash ^= keys[point_num][count]
+                    occ |= 1 << point_num
+                    if count >= 2:
+                        ge2 |= 1 << point_num
+            zobrist_hash ^= keys[0][self.bar[idx]] ^ keys[borne_off_slot][self.borne_off[idx]]
+            self.occ[idx] = occ
+            self.ge2[idx] = ge2
+            home_start, home_end = self.home_range[idx]
+            distances = self.bear_dist[idx]
+            self.max_bear_dist[idx] = max(
+                (distances[p] for p in range(home_start, home_end + 1) if row[p] > 0),
+                default=0,
+            )
+        self.zobrist_hash = zobrist_hash
+    
+    def snapshot(self) -> Tuple[List[int], List[int]]:
+        """Get (white, black) piece counts per point; index i holds point i + 1."""
+        return (
+            self.counts[PlayerColor.WHITE.idx][1:],
+            self.counts[PlayerColor.BLACK.idx][1:],
+        )
+    
+    def summary(self) -> Tuple[int, int, int, int]:
+        """Get (bar white, bar black, borne off white, borne off black)."""
+        bar = self.bar
+        borne_off = self.borne_off
+        return bar[0], bar[1], borne_off[0], borne_off[1]
+    
+    def checkpoint(self) -> Tuple[int, Tuple[int, ...]]:
+        """Start recording changes so they can be undone with ``rollback``.
+        
+        Checkpoints nest; lets the AI search play moves in place instead of
+        copying the board at every node.
+        
+        Returns:
+            Token to pass to ``rollback``
+        """
+        if self._journal is None:
+            self._journal = []
+        self._journal_depth += 1
+        return len(self._journal), tuple(self.max_bear_dist)
+    
+    def rollback(self, token: Tuple[int, Tuple[int, ...]]):
+        """Undo all changes made since the checkpoint that returned ``token``.
+
+        Checkpoints must be rolled back innermost first.
+        """
+        length, max_bear_dist = token
+        journal = self._journal
+        borne_off_slot = self.num_points + 1
+        while len(journal) > length:
+            idx, slot, old_count = journal.pop()
+            if slot == 0:
+                current = self.bar[idx]
+                self.bar[idx] = old_count
+            elif slot == borne_off_slot:
+                current = self.borne_off[idx]
+                self.borne_off[idx] = old_count
+            else:
+                row = self.counts[idx]
+                current = row[slot]
+                row[slot] = old_count
+                self._update_masks(idx, slot, old_count)
+            keys = ZOBRIST[idx][slot]
+            self.zobrist_hash ^= keys[current] ^ keys[old_count]
+        self.max_bear_dist[:] = max_bear_dist
+        self._journal_depth -= 1
+        if self._journal_depth == 0:
+            self._journal = None
     
     def get_point(self, point_num: int) -> Optional[Point]:
         """Get point by number."""
@@ -98,113 +314,97 @@ class Board:
     
     def get_bar_count(self, color: PlayerColor) -> int:
         """Get number of pieces on bar for given color."""
-        return self.bar.get(color, 0)
+        return self.bar[color.idx]
     
     def add_to_bar(self, color: PlayerColor, count: int = 1):
         """Add pieces to bar."""
-        self.bar[color] = self.bar.get(color, 0) + count
+        idx = color.idx
+        current = self.bar[idx]
+        self.bar[idx] = current + count
+        self._update_hash(color, 0, current, self.bar[idx])
     
     def remove_from_bar(self, color: PlayerColor, count: int = 1):
         """Remove pieces from bar."""
-        self.bar[color] = max(0, self.bar.get(color, 0) - count)
+        idx = color.idx
+        current = self.bar[idx]
+        self.bar[idx] = max(0, current - count)
+        self._update_hash(color, 0, current, self.bar[idx])
     
     def bear_off(self, color: PlayerColor, count: int = 1):
         """Bear off pieces."""
-        self.borne_off[color] = self.borne_off.get(color, 0) + count
+        idx = color.idx
+        current = self.borne_off[idx]
+        self.borne_off[idx] = current + count
+        self._update_hash(color, self.num_points + 1, current, self.borne_off[idx])
     
     def get_bearing_off_point(self, color: PlayerColor) -> Tuple[int, int]:
         """Get the range of points where pieces can bear off.
         Returns (start, end) inclusive.
+        """
+        return self.home_range[color.idx]
+    
+    def _compute_bearing_off_point(self, color: PlayerColor) -> Tuple[int, int]:
+        """Compute the bear-off range for a color from the rules.
         Based on movement direction: for clockwise movement (-1), home is 1-6 for both players.
         For counter-clockwise movement (1), white bears off 1-6, black bears off 19-24.
         """
         if self.rules:
-            direction = self.rules.get_direction(color)
-            if direction == -1:
-                # Clockwise movement - both players bear off at low end
-                return (1, 6)
-            else:
-                # Counter-clockwise movement - standard backgammon
-                if color == PlayerColor.WHITE:
-                    return (1, 6)
-                else:
-                    return (19, 24)
+            # Derived once per variant from the movement directions
+            return self.rules.home_ranges[color.idx]
         else:
             # Fallback to standard backgammon
-            if color == PlayerColor.WHITE:
+            if color is PlayerColor.WHITE:
                 return (1, 6)
             else:
                 return (19, 24)
     
     def can_bear_off(self, color: PlayerColor) -> bool:
         """Check if player can bear off (all pieces in home board)."""
-        home_start, home_end = self.get_bearing_off_point(color)
-        
-        # Check if any pieces outside home board
-        for point_num, point in self.points.items():
-            if point_num < home_start or point_num > home_end:
-                if point.get_pieces(color) > 0:
-                    return False
-        
-        # Check bar
-        if self.get_bar_count(color) > 0:
-            return False
-        
-        return True
+        idx = color.idx
+        return self.bar[idx] == 0 and not self.occ[idx] & self.outside_home[idx]
     
     def get_all_pieces(self, color: PlayerColor) -> int:
         """Get total number of pieces on board (including bar, excluding borne off)."""
-        total = self.get_bar_count(color)
-        for point in self.points.values():
-            total += point.get_pieces(color)
-        return total
+        return self.bar[color.idx] + sum(self.counts[color.idx])
     
     def get_pieces_in_home(self, color: PlayerColor) -> int:
         """Get number of pieces in home board."""
-        home_start, home_end = self.get_bearing_off_point(color)
-        total = 0
-        for point_num in range(home_start, home_end + 1):
-            total += self.points[point_num].get_pieces(color)
-        return total
+        home_start, home_end = self.home_range[color.idx]
+        return sum(self.counts[color.idx][home_start:home_end + 1])
     
     def copy(self) -> 'Board':
         """Create a deep copy of the board."""
-        new_board = Board(self.num_points, self.rules)
-        new_board.bar = self.bar.copy()
-        new_board.borne_off = self.borne_off.copy()
-        for point_num, point in self.points.items():
-            new_board.points[point_num] = Point(
-                point.number,
-                point.pieces.copy()
-            )
+        # Built field by field: copies are made for every AI search node, and
+        # the home range and distance tables never change so they are shared
+        new_board = Board.__new__(Board)
+        new_board.num_points = self.num_points
+        new_board.counts = [row[:] for row in self.counts]
+        new_board._points = None
+        new_board.bar = self.bar[:]
+        new_board.borne_off = self.borne_off[:]
+        new_board.rules = self.rules
+        new_board.zobrist_hash = self.zobrist_hash
+        new_board.home_range = self.home_range
+        new_board.bear_dist = self.bear_dist
+        new_board.outside_home = self.outside_home
+        new_board.max_bear_dist = self.max_bear_dist[:]
+        new_board.occ = self.occ[:]
+        new_board.ge2 = self.ge2[:]
+        new_board._journal = None
+        new_board._journal_depth = 0
         return new_board
     
     def __str__(self) -> str:
         """String representation of board."""
-        lines = []
-        lines.append("=" * 50)
-        lines.append(f"Bar - White: {self.bar[PlayerColor.WHITE]}, Black: {self.bar[PlayerColor.BLACK]}")
-        lines.append(f"Borne Off - White: {self.borne_off[PlayerColor.WHITE]}, Black: {self.borne_off[PlayerColor.BLACK]}")
-        lines.append("-" * 50)
-        
-        # Top row (points 13-24)
-        top_row = []
-        for i in range(24, 12, -1):
-            point = self.points[i]
-            w = point.get_pieces(PlayerColor.WHITE)
-            b = point.get_pieces(PlayerColor.BLACK)
-            top_row.append(f"{i:2d}:W{w}B{b}")
-        lines.append(" ".join(top_row))
-        
-        # Bottom row (points 1-12)
-        bottom_row = []
-        for i in range(1, 13):
-            point = self.points[i]
-            w = point.get_pieces(PlayerColor.WHITE)
-            b = point.get_pieces(PlayerColor.BLACK)
-            bottom_row.append(f"{i:2d}:W{w}B{b}")
-        lines.append(" ".join(bottom_row))
-        lines.append("=" * 50)
-        
-        return "\n".join(lines)
-
+        white_idx, black_idx = PlayerColor.WHITE.idx, PlayerColor.BLACK.idx
+        white, black = self.counts[white_idx], self.counts[black_idx]
+        return "\n".join((
+            _BORDER,
+            f"Bar - White: {self.bar[white_idx]}, Black: {self.bar[black_idx]}",
+            f"Borne Off - White: {self.borne_off[white_idx]}, Black: {self.borne_off[black_idx]}",
+            _SEPARATOR,
+            # Top row (points 13-24), then bottom row (points 1-12)
+            " ".join([f"{i:2d}:W{white[i]}B{black[i]}" for i in range(24, 12, -1)]),
+            " ".join([f"{i:2d}:W{white[i]}B{black[i]}" for i in range(1, 13)]),
+            _BORDER,
+        ))
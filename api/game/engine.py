@@ -7,8 +7,61 @@ from .move import Move, MoveType
 from rules.base import RuleSet
 
 
+# All 36 ordered dice rolls
+_DICE_ROLLS = tuple((die1, die2) for die1 in range(1, 7) for die2 in range(1, 7))
+
+
+def _scan_normal_moves(
+    own_occ: int,
+    own_ge2: int,
+    opp_occ: int,
+    opp_ge2: int,
+    targets: List[List[Optional[int]]],
+    dice: List[int],
+) -> Tuple[List[int], List[Tuple[int, int, int]]]:
+    """Scan the board for single-die normal move candidates.
+    
+    Pure integer kernel over the per-color point bitboards and the target
+    lookup table: no Move objects and no rule callbacks, so only the
+    surviving candidates are materialized and validated by the caller.
+    
+    Args:
+        own_occ: Bitboard of points holding pieces of the moving color
+        own_ge2: Bitboard of points holding 2+ pieces of the moving color
+        opp_occ: Bitboard of points holding opponent pieces
+        opp_ge2: Bitboard of points holding 2+ opponent pieces
+        targets: Target lookup table of the moving color, [from_point][die]
+        dice: Die values to try
+    
+    Returns:
+        Tuple of (movable points, [(from_point, to_point, die), ...])
+    """
+    movable = []
+    candidates = []
+    # Skip pinned checkers (a single piece sharing its point with the
+    # opponent, in pinning variants); empty points are never visited
+    remaining = own_occ & ~(opp_occ & ~own_ge2)
+    while remaining:
+        low = remaining & -remaining
+        remaining ^= low
+        from_point = low.bit_length() - 1
+        movable.append(from_point)
+        row = targets[from_point]
+        for die in dice:
+            target = row[die]
+            # Points held by 2+ opponent pieces can never be landed on
+            if target is not None and not (opp_ge2 >> target) & 1:
+                candidates.append((from_point, target, die))
+    return movable, candidates
+
+
 class GameEngine:
     """Main game engine for backgammon."""
+
+    # Maximum number of cached legal move lists before the cache is reset
+    LEGAL_CACHE_SIZE = 4096
+    # Maximum number of cached rule validations before the cache is reset
+    VALIDATE_CACHE_SIZE = 1 << 16
     
     def __init__(self, rules: RuleSet):
         """Initialize game engine with rules.
@@ -20,14 +73,82 @@ class GameEngine:
         self.board = Board(rules=rules)
         self.current_player: Optional[PlayerColor] = None
         self.current_dice: Optional[Tuple[int, int]] = None
-        self.used_dice: List[int] = []
+        # Used dice: bit i of _used_mask marks die i of a normal roll as used;
+        # _doubles_used counts the uses consumed from a doubles roll
+        self._used_mask = 0
+        self._doubles_used = 0
+        # Memoized result of get_available_dice_list (None when stale)
+        self._available_dice: Optional[List[int]] = None
         self.game_over = False
         self.winner: Optional[PlayerColor] = None
         self.total_checkers_per_player: Dict[PlayerColor, int] = {
             PlayerColor.WHITE: 15,
             PlayerColor.BLACK: 15
         }
+        # Legal moves keyed by (board hash, dice, used dice, player)
+        self._legal_cache: Dict[Tuple, List[Move]] = {}
+        # Rule legality of moves keyed by (board hash, move, dice)
+        self._validate_cache: Dict[Tuple, bool] = {}
+        self._build_lookup_tables()
+
+    def _build_lookup_tables(self):
+        """Precompute move targets and bearing distances per color.
+
+        ``_target_lut[color.idx][from_point][die]`` is the target point (or None
+        when off the board), ``_enter_lut[color.idx][die]`` the point entered
+        from the bar and ``_bear_dist_lut[color.idx][point]`` the bearing
+        distance, so the move generator does table lookups instead of
+        branching on color and direction for every point and die.
+        """
+        num_points = self.board.num_points
+        self._target_lut: List[List[List[Optional[int]]]] = []
+        self._enter_lut: List[List[int]] = []
+        self._bear_dist_lut: List[List[int]] = []
+        for color in PlayerColor:
+            direction = self.rules.get_direction(color)
+            if direction == -1:
+                # Moving clockwise (decreasing point numbers)
+                self._enter_lut.append([num_points + 1 - die for die in range(num_points + 1)])
+            else:
+                # Moving counter-clockwise (increasing point numbers)
+                self._enter_lut.append(list(range(num_points + 1)))
+            targets = []
+            for from_point in range(num_points + 1):
+                row = []
+                for die in range(num_points + 1):
+                    target = from_point + direction * die
+                    row.append(target if 1 <= target <= num_points else None)
+                targets.append(row)
+            self._target_lut.append(targets)
+
+            if direction == -1 or color is PlayerColor.WHITE:
+                # Clockwise movement - both players bear off at low end
+                distances = list(range(num_points + 1))
+            else:
+                # Counter-clockwise movement - standard backgammon
+                distances = [num_points + 1 - p for p in range(num_points + 1)]
+            self._bear_dist_lut.append(distances)
     
+    def __getstate__(self) -> Dict:
+        """Pickle without the move caches (e.g. when sent to search workers)."""
+        state = self.__dict__.copy()
+        state["_legal_cache"] = {}
+        state["_validate_cache"] = {}
+        return state
+
+    def copy(self) -> 'GameEngine':
+        """Copy the game state, e.g. for the AI to search without touching this game.
+
+        The copy gets its own board and empty move caches; rules and lookup
+        tables are shared.
+        """
+        new_engine = GameEngine.__new__(GameEngine)
+        new_engine.__dict__.update(self.__getstate__())
+        new_engine.board = self.board.copy()
+        new_engine._available_dice = None
+        new_engine.total_checkers_per_player = dict(self.total_checkers_per_player)
+        return new_engine
+
     def start_game(self, initial_setup: Dict[PlayerColor, Dict[int, int]]):
         """Start a new game with initial board setup.
         
@@ -41,6 +162,8 @@ class GameEngine:
                 self.total_checkers_per_player[color] = total
         
         self.board.setup_initial(initial_setup)
+        self._legal_cache.clear()
+        self._validate_cache.clear()
         self.current_player = PlayerColor.WHITE
         self.game_over = False
         self.winner = None
@@ -51,12 +174,54 @@ class GameEngine:
         Returns:
             Tuple of (die1, die2)
         """
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
-        self.current_dice = (die1, die2)
-        self.used_dice = []
+        # One draw over all 36 outcomes instead of two randint calls
+        self.current_dice = random.choice(_DICE_ROLLS)
+        self._set_dice_usage(0, 0)
+        # Positions from previous rolls can't recur with the new dice
+        self._legal_cache.clear()
         return self.current_dice
     
+    @property
+    def used_dice(self) -> List[int]:
+        """Die values consumed so far this turn."""
+        if not self.current_dice:
+            return []
+        if self.is_doubles():
+            return [self.current_dice[0]] * self._doubles_used
+        return [d for i, d in enumerate(self.current_dice) if self._used_mask & (1 << i)]
+    
+    @used_dice.setter
+    def used_dice(self, value: List[int]):
+        mask = 0
+        if self.current_dice and not self.is_doubles():
+            for i, die in enumerate(self.current_dice):
+                if die in value:
+                    mask |= 1 << i
+        self._set_dice_usage(mask, len(value) if self.is_doubles() else 0)
+    
+    def get_dice_state(self) -> Tuple[Optional[Tuple[int, int]], int, int]:
+        """Get a compact snapshot of the dice state (dice, used mask, doubles used)."""
+        return self.current_dice, self._used_mask, self._doubles_used
+    
+    def set_dice_state(self, state: Tuple[Optional[Tuple[int, int]], int, int]):
+        """Restore a dice state captured by get_dice_state."""
+        self.current_dice = state[0]
+        self._set_dice_usage(state[1], state[2])
+    
+    def _set_dice_usage(self, used_mask: int, doubles_used: int):
+        """Set used dice bookkeeping and invalidate the available dice cache."""
+        self._used_mask = used_mask
+        self._doubles_used = doubles_used
+        self._available_dice = None
+    
+    def _use_die(self, die_value: int):
+        """Mark one die of a normal roll as used."""
+        die1, die2 = self.current_dice
+        if die_value == die1 and not self._used_mask & 1:
+            self._set_dice_usage(self._used_mask | 1, 0)
+        elif die_value == die2:
+            self._set_dice_usage(self._used_mask | 2, 0)
+    
     def is_doubles(self) -> bool:
         """Check if current dice roll is doubles."""
         if not self.current_dice:
@@ -67,20 +232,25 @@ class GameEngine:
         """Get list of available dice values to use.
         For doubles (e.g., 2-2), returns [2, 2, 2, 2] (4 moves).
         For normal roll (e.g., 2-3), returns [2, 3].
+        
+        The list is memoized until dice are rolled or used; callers must not
+        modify it.
         """
         if not self.current_dice:
             return []
         
-        if self.is_doubles():
-            # Doubles: 4 moves of the same value
-            die_value = self.current_dice[0]
-            total_moves = getattr(self.rules, "doubles_uses", 4)
-            used_count = self.used_dice.count(die_value)
-            remaining = total_moves - used_count
-            return [die_value] * remaining
-        else:
-            # Normal roll: return unused dice
-            return [d for d in self.current_dice if d not in self.used_dice]
+        if self._available_dice is None:
+            die1, die2 = self.current_dice
+            if die1 == die2:
+                # Doubles: 4 moves of the same value
+                total_moves = getattr(self.rules, "doubles_uses", 4)
+                self._available_dice = [die1] * (total_moves - self._doubles_used)
+            else:
+                # Normal roll: return unused dice
+                self._available_dice = (
+                    [die1] * (not self._used_mask & 1) + [die2] * (not self._used_mask & 2)
+                )
+        return self._available_dice
     
     def get_legal_moves(self, dice: Optional[Tuple[int, int]] = None) -> List[Move]:
         """Get all legal moves for current player.
@@ -97,81 +267,93 @@ class GameEngine:
         if dice is None or self.current_player is None:
             return []
         
+        # The key covers all state move generation depends on, so entries stay
+        # valid across make_move/undo during AI search
+        key = (self.board.zobrist_hash, dice, self._used_mask, self._doubles_used, self.current_player)
+        cached = self._legal_cache.get(key)
+        if cached is None:
+            if len(self._legal_cache) >= self.LEGAL_CACHE_SIZE:
+                self._legal_cache.clear()
+            cached = self._generate_legal_moves(dice)
+            self._legal_cache[key] = cached
+        return list(cached)
+    
+    def _generate_legal_moves(self, dice: Tuple[int, int]) -> List[Move]:
+        """Generate all legal moves for current player (uncached).
+        
+        Args:
+            dice: Dice roll used for validation
+        
+        Returns:
+            List of legal moves
+        """
         available_dice = self.get_available_dice_list()
         if not available_dice:
             return []
         
+        # With doubles every remaining use is the same die value, so single-die
+        # moves only need generating once; multiplicity stays in the dice state
+        distinct_dice = available_dice[:1] if self.is_doubles() else available_dice
+        
         # Check for pieces on bar first
         if self.board.get_bar_count(self.current_player) > 0:
-            return self._get_enter_moves(self.current_player, dice, available_dice)
+            return self._get_enter_moves(self.current_player, dice, distinct_dice)
         
         moves = []
+        color = self.current_player
+        board = self.board
+        own_idx, opp_idx = color.idx, color.opp_idx
+        opp_ge2 = board.ge2[opp_idx]
         
         # Get normal moves using individual dice
-        for point_num in range(1, self.board.num_points + 1):
-            point = self.board.get_point(point_num)
-            # Skip pinned checkers (in pinning variants)
-            if point.is_pinned(self.current_player):
-                continue
-            if point.get_pieces(self.current_player) > 0:
-                for die in available_dice:
-                    target = self._calculate_target(self.current_player, point_num, die)
-                    if target:
-                        move = Move(
-                            color=self.current_player,
-                            move_type=MoveType.NORMAL,
-                            from_point=point_num,
-                            to_point=target,
-                            die_value=die
-                        )
-                        if self._is_legal_move(move, dice):
-                            moves.append(move)
+        movable, candidates = _scan_normal_moves(
+            board.occ[own_idx], board.ge2[own_idx], board.occ[opp_idx], opp_ge2,
+            self._target_lut[own_idx], distinct_dice,
+        )
+        if self.rules.normal_moves_prevalidated:
+            # The scan already applied every check the rules would make
+            moves = [
+                Move.make(color, MoveType.NORMAL, from_point, target, die)
+                for from_point, target, die in candidates
+            ]
+        else:
+            for from_point, target, die in candidates:
+                move = Move.make(color, MoveType.NORMAL, from_point, target, die)
+                if self._is_legal_move(move, dice):
+                    moves.append(move)
 
-                # For doubles, also generate cumulative moves for the same checker
-                # (e.g. 3, 6, 9, 12 with 3-3 and 4 uses available), only when each
-                # intermediate step is legal on a simulated board.
-                if self.is_doubles() and available_dice:
-                    base_die = available_dice[0]
-                    max_steps = len(available_dice)
-                    for steps in range(2, max_steps + 1):
-                        target = self._simulate_cumulative_normal_target(
-                            board=self.board.copy(),
-                            color=self.current_player,
-                            from_point=point_num,
-                            base_die=base_die,
-                            steps=steps,
-                            dice=dice,
-                        )
-                        if target is not None:
-                            moves.append(
-                                Move(
-                                    color=self.current_player,
-                                    move_type=MoveType.NORMAL,
-                                    from_point=point_num,
-                                    to_point=target,
-                                    die_value=base_die * steps,
-                                )
-                            )
-                
-                # Also generate moves using sum of both dice (only for non-doubles and allowed by rules)
-                if (
-                    self.rules.allow_combined_normal
-                    and not self.is_doubles()
-                    and len(available_dice) == 2
-                    and not self.board.can_bear_off(self.current_player)
-                ):
-                    combined_die = sum(available_dice)
-                    target = self._calculate_target(self.current_player, point_num, combined_die)
-                    if target:
-                        move = Move(
-                            color=self.current_player,
-                            move_type=MoveType.NORMAL,
-                            from_point=point_num,
-                            to_point=target,
-                            die_value=combined_die
-                        )
-                        if self._is_legal_move(move, dice):
-                            moves.append(move)
+        for point_num in movable:
+            # For doubles, also generate cumulative moves for the same checker
+            # (e.g. 3, 6, 9, 12 with 3-3 and 4 uses available), only when each
+            # intermediate step is legal on a simulated board.
+            if self.is_doubles() and available_dice:
+                base_die = available_dice[0]
+                max_steps = len(available_dice)
+                for steps in range(2, max_steps + 1):
+                    target = self._simulate_cumulative_normal_target(
+                        board=self.board.copy(),
+                        color=color,
+                        from_point=point_num,
+                        base_die=base_die,
+                        steps=steps,
+                        dice=dice,
+                    )
+                    if target is not None:
+                        moves.append(Move.make(color, MoveType.NORMAL, point_num, target, base_die * steps))
+            
+            # Also generate moves using sum of both dice (only for non-doubles and allowed by rules)
+            if (
+                self.rules.allow_combined_normal
+                and not self.is_doubles()
+                and len(available_dice) == 2
+                and not self.board.can_bear_off(color)
+            ):
+                combined_die = sum(available_dice)
+                target = self._calculate_target(color, point_num, combined_die)
+                if target and not (opp_ge2 >> target) & 1:
+                    move = Move.make(color, MoveType.NORMAL, point_num, target, combined_die)
+                    if self._is_legal_move(move, dice):
+                        moves.append(move)
         
         # Check bearing off
         if self.board.can_bear_off(self.current_player):
@@ -179,20 +361,56 @@ class GameEngine:
             for point_num in range(home_start, home_end + 1):
                 point = self.board.get_point(point_num)
                 if point.get_pieces(self.current_player) > 0:
-                    for die in available_dice:
+                    for die in distinct_dice:
                         if not self._can_bear_off_with_die(self.current_player, point_num, die):
                             continue
-                        move = Move(
-                            color=self.current_player,
-                            move_type=MoveType.BEAR_OFF,
-                            from_point=point_num,
-                            die_value=die
-                        )
+                        move = Move.make(self.current_player, MoveType.BEAR_OFF, point_num, None, die)
                         if self._is_legal_move(move, dice):
                             moves.append(move)
         
         return moves
     
+    def get_distinct_legal_moves(self) -> List[Move]:
+        """Get legal moves, dropping combined moves equivalent to two single-die moves.
+        
+        A combined move (sum of both dice) ends in the same position as playing
+        the two dice one after the other whenever the intermediate point can be
+        reached without touching an opponent checker. The UI offers it as a
+        shortcut, but searching it as well only re-evaluates the same position.
+        
+        Returns:
+            List of legal moves without redundant combined moves
+        """
+        moves = self.get_legal_moves()
+        available_dice = self.get_available_dice_list()
+        if self.is_doubles() or len(available_dice) != 2:
+            return moves
+        
+        color = self.current_player
+        opp = self.board.counts[color.opp_idx]
+        combined_die = sum(available_dice)
+        # One pass splits normal moves into single-die and combined moves
+        singles = set()
+        combined = []
+        for move in moves:
+            if move.move_type is MoveType.NORMAL:
+                if move.die_value == combined_die:
+                    combined.append(move)
+                else:
+                    singles.add((move.from_point, move.to_point))
+        
+        targets = self._target_lut[color.idx]
+        redundant = set()
+        for move in combined:
+            for die in available_dice:
+                mid = targets[move.from_point][die]
+                if (move.from_point, mid) in singles and opp[mid] == 0:
+                    redundant.add(move)
+                    break
+        if not redundant:
+            return moves
+        return [move for move in moves if move not in redundant]
+    
     def _get_enter_moves(self, color: PlayerColor, dice: Tuple[int, int], available_dice: List[int]) -> List[Move]:
         """Get legal moves for entering from bar.
         
@@ -205,15 +423,12 @@ class GameEngine:
             List of legal enter moves
         """
         moves = []
+        enter_targets = self._enter_lut[color.idx]
+        opp_ge2 = self.board.ge2[color.opp_idx]
         for die in available_dice:
-            target = self._calculate_enter_target(color, die)
-            if target and self.board.get_point(target).can_land(color):
-                move = Move(
-                    color=color,
-                    move_type=MoveType.ENTER,
-                    to_point=target,
-                    die_value=die
-                )
+            target = enter_targets[die]
+            if target and not (opp_ge2 >> target) & 1:
+                move = Move.make(color, MoveType.ENTER, None, target, die)
                 if self._is_legal_move(move, dice):
                     moves.append(move)
         
@@ -221,46 +436,24 @@ class GameEngine:
     
     def _calculate_target(self, color: PlayerColor, from_point: int, die: int) -> Optional[int]:
         """Calculate target point for a move using variant movement direction."""
-        direction = self.rules.get_direction(color)
-        target = from_point + (direction * die)
-        
-        if 1 <= target <= 24:
-            return target
-        return None
+        if die > self.board.num_points:
+            return None
+        return self._target_lut[color.idx][from_point][die]
     
     def _calculate_enter_target(self, color: PlayerColor, die: int) -> Optional[int]:
         """Calculate target point when entering from bar using variant movement direction."""
-        direction = self.rules.get_direction(color)
-        if direction == -1:
-            # Moving clockwise (decreasing point numbers)
-            return 24 - die + 1
-        else:
-            # Moving counter-clockwise (increasing point numbers)
-            return die
+        return self._enter_lut[color.idx][die]
 
     def _bearing_distance(self, color: PlayerColor, point_num: int) -> int:
         """Calculate bearing distance from a point based on movement direction."""
-        direction = self.rules.get_direction(color)
-        if direction == -1:
-            # Clockwise movement - both players bear off at low end
-            return point_num
-        else:
-            # Counter-clockwise movement - standard backgammon
-            return point_num if color == PlayerColor.WHITE else 25 - point_num
+        return self._bear_dist_lut[color.idx][point_num]
 
     def _max_bearing_distance(self, color: PlayerColor) -> int:
         """Get the maximum bearing distance among occupied home points."""
-        home_start, home_end = self.board.get_bearing_off_point(color)
-        max_dist = 0
-        for p in range(home_start, home_end + 1):
-            if self.board.get_point(p).get_pieces(color) > 0:
-                d = self._bearing_distance(color, p)
-                if d > max_dist:
-                    max_dist = d
-        return max_dist
+        return self.board.max_bear_dist[color.idx]
 
     def _can_bear_off_with_die(self, color: PlayerColor, from_point: int, die: int) -> bool:
-        distance = self._bearing_distance(color, from_point)
+        distance = self._bear_dist_lut[color.idx][from_point]
         max_dist = self._max_bearing_distance(color)
         if die == distance:
             return True
@@ -299,14 +492,8 @@ class GameEngine:
         if target is None:
             return None
 
-        move = Move(
-            color=color,
-            move_type=MoveType.NORMAL,
-            from_point=from_point,
-            to_point=target,
-            die_value=die_value,
-        )
-        valid, _ = self.rules.validate_move(board, color, move, dice)
+        move = Move.make(color, MoveType.NORMAL, from_point, target, die_value)
+        valid = self._is_legal_move(move, dice, board)
         if not valid:
             return None
 
@@ -345,14 +532,27 @@ class GameEngine:
             current = next_point
         return current
     
-    def _is_legal_move(self, move: Move, dice: Tuple[int, int]) -> bool:
-        """Check if a move is legal according to variant rules."""
-        valid, _ = self.rules.validate_move(
-            self.board,
-            move.color,
-            move,
-            dice
-        )
+    def _is_legal_move(self, move: Move, dice: Tuple[int, int], board: Optional[Board] = None) -> bool:
+        """Check if a move is legal according to variant rules, memoized by position.
+        
+        Rule validation only depends on the board, the move and the dice, so
+        results are keyed on the board's Zobrist hash and reused whenever the
+        same position is validated again (e.g. during AI search).
+        
+        Args:
+            move: Move to check
+            dice: Dice roll used for validation
+            board: Board to check on (defaults to the game board)
+        """
+        if board is None:
+            board = self.board
+        key = (board.zobrist_hash, move, dice)
+        valid = self._validate_cache.get(key)
+        if valid is None:
+            if len(self._validate_cache) >= self.VALIDATE_CACHE_SIZE:
+                self._validate_cache.clear()
+            valid = self.rules.is_legal(board, move.color, move, dice)
+            self._validate_cache[key] = valid
         return valid
     
     def make_move(self, move: Move) -> Tuple[bool, List[str]]:
@@ -384,13 +584,7 @@ class GameEngine:
         if not valid:
             return False, explanations
         
-        # Execute move
-        if (
-            move.move_type == MoveType.NORMAL
-            and self.is_doubles()
-            and self.current_dice
-            and move.die_value > self.current_dice[0]
-        ):
+        if self._is_cumulative_doubles_move(move):
             base_die = self.current_dice[0]
             if move.die_value % base_die != 0:
                 return False, ["Invalid cumulative doubles move distance"]
@@ -400,26 +594,40 @@ class GameEngine:
             if steps > remaining_steps:
                 return False, ["Not enough doubles uses remaining for this move"]
 
+        if not self.make_move_trusted(move):
+            return False, ["Cumulative doubles path is blocked or invalid"]
+
+        return True, explanations
+
+    def make_move_trusted(self, move: Move) -> bool:
+        """Execute a move without validating it against the rules.
+
+        Only for moves returned by get_legal_moves for the current position
+        and dice (e.g. during AI search); other input must go through make_move.
+
+        Args:
+            move: Legal move to execute
+
+        Returns:
+            False if a cumulative doubles path turned out to be blocked
+        """
+        # Execute move
+        if self._is_cumulative_doubles_move(move):
+            steps = move.die_value // self.current_dice[0]
             final_target = self._simulate_cumulative_normal_target(
                 board=self.board,
                 color=move.color,
                 from_point=move.from_point,
-                base_die=base_die,
+                base_die=self.current_dice[0],
                 steps=steps,
                 dice=self.current_dice,
             )
             if final_target is None or final_target != move.to_point:
-                return False, ["Cumulative doubles path is blocked or invalid"]
+                return False
 
-            self.used_dice.extend([base_die] * steps)
-
-            # Check for win - use variant-specific checker count
-            total_checkers = self.total_checkers_per_player.get(move.color, 15)
-            if self.board.borne_off[move.color] >= total_checkers:
-                self.game_over = True
-                self.winner = move.color
-
-            return True, explanations
+            self._set_dice_usage(0, self._doubles_used + steps)
+            self._check_win(move.color)
+            return True
 
         if move.move_type == MoveType.ENTER:
             self.board.remove_from_bar(move.color, 1)
@@ -448,24 +656,36 @@ class GameEngine:
                 # Doubles: mark one use of the die value
                 die_value = self.current_dice[0]
                 if move.die_value == die_value:
-                    self.used_dice.append(die_value)
+                    self._set_dice_usage(0, self._doubles_used + 1)
             else:
                 # Normal roll
-                available_dice = [d for d in self.current_dice if d not in self.used_dice]
+                available_dice = self.get_available_dice_list()
                 if move.move_type == MoveType.NORMAL and len(available_dice) == 2 and move.die_value == sum(available_dice):
                     # Combined move - only for normal moves
-                    self.used_dice.extend(available_dice)
+                    self._set_dice_usage(0b11, 0)
                 elif move.die_value in available_dice:
                     # Single die move (including bear off)
-                    self.used_dice.append(move.die_value)
+                    self._use_die(move.die_value)
         
-        # Check for win - use variant-specific checker count
-        total_checkers = self.total_checkers_per_player.get(move.color, 15)
-        if self.board.borne_off[move.color] >= total_checkers:
+        self._check_win(move.color)
+        return True
+
+    def _is_cumulative_doubles_move(self, move: Move) -> bool:
+        """Check if a move spends several uses of a doubles roll at once."""
+        return (
+            move.move_type == MoveType.NORMAL
+            and self.is_doubles()
+            and bool(self.current_dice)
+            and move.die_value > self.current_dice[0]
+        )
+
+    def _check_win(self, color: PlayerColor):
+        """End the game if the color has borne off all its checkers."""
+        # Use variant-specific checker count
+        total_checkers = self.total_checkers_per_player.get(color, 15)
+        if self.board.borne_off[color.idx] >= total_checkers:
             self.game_over = True
-            self.winner = move.color
-        
-        return True, explanations
+            self.winner = color
     
     def explain_move(self, move: Move) -> List[str]:
         """Explain why a move is legal or illegal.
@@ -493,13 +713,15 @@ class GameEngine:
         if self.current_player:
             self.current_player = self.current_player.opposite()
         self.current_dice = None
-        self.used_dice = []
+        self._set_dice_usage(0, 0)
     
     def has_remaining_moves(self) -> bool:
         """Check if player has remaining dice to use."""
         if not self.current_dice:
             return False
-        return len(self.get_available_dice_list()) > 0
+        if self.is_doubles():
+            return self._doubles_used < getattr(self.rules, "doubles_uses", 4)
+        return self._used_mask != 0b11
     
     def get_board_state(self) -> str:
         """Get string representation of board state."""
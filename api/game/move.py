@@ -1,7 +1,7 @@
 """Move representation and types."""
 
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from .board import PlayerColor
 
@@ -13,9 +13,13 @@ class MoveType(Enum):
     BEAR_OFF = "bear_off"  # Bear off a piece
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Move:
-    """Represents a single move."""
+    """Represents a single move.
+    
+    Moves are immutable; use ``Move.make`` on hot paths to reuse pooled
+    instances instead of allocating (and validating) a new one each time.
+    """
     color: PlayerColor
     move_type: MoveType
     from_point: Optional[int] = None  # None for enter/bear_off
@@ -43,6 +47,26 @@ class Move:
         elif self.move_type == MoveType.BEAR_OFF:
             return f"{self.color.value}: Bear off from {self.from_point} (die: {self.die_value})"
         return f"{self.color.value}: {self.move_type.value}"
+    
+    @staticmethod
+    def make(
+        color: PlayerColor,
+        move_type: MoveType,
+        from_point: Optional[int] = None,
+        to_point: Optional[int] = None,
+        die_value: int = 0,
+    ) -> 'Move':
+        """Get the pooled Move for the given fields, creating it on first use."""
+        key = (color, move_type, from_point, to_point, die_value)
+        move = _MOVE_POOL.get(key)
+        if move is None:
+            move = _MOVE_POOL[key] = Move(color, move_type, from_point, to_point, die_value)
+        return move
+
+
+# Pool of Move instances shared by all engines. Moves are immutable and the set
+# of distinct moves is bounded by the board size, so entries are never evicted.
+_MOVE_POOL: Dict[Tuple, Move] = {}
 
 
 @dataclass
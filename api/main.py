@@ -1,14 +1,57 @@
 """FastAPI backend for backgammon game engine."""
 
+import asyncio
 import os
-from fastapi import FastAPI, Query
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Type, TypeVar
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
 
+from game.engine import GameEngine
 from schemas.game import GameCreate, MoveRequest, SetPlayerRequest, GameState
 from services.game_service import GameService
 from services.variant_service import VariantService
 
-app = FastAPI(title="TABLA BAKI API", version="1.0.0")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core.
+
+    Models, dicts and tuples are serialized in one native call. Endpoints on
+    the game hot path return it directly so FastAPI skips jsonable_encoder
+    and response_model re-validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+# Initialize services
+game_service = GameService()
+variant_service = VariantService()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load all variant configs before serving requests; close the game store on shutdown."""
+    variant_service.preload()
+    yield
+    game_service.games.close()
+
+
+app = FastAPI(
+    title="TABLA BAKI API",
+    version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
 
 # CORS middleware
 cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
@@ -20,90 +63,162 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-game_service = GameService()
-variant_service = VariantService()
+
+async def run_game_op(func: Callable, *args) -> Any:
+    """Call a function that reads or writes the game store.
+
+    With the in-memory store the call runs right here on the event loop; a
+    store that waits on the network (Redis) is called in the threadpool so
+    its round trips don't hold up other requests.
+    """
+    if game_service.games.blocking:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+async def get_engine(game_id: str) -> GameEngine:
+    """Resolve the engine of the game in the path, or raise 404."""
+    return await run_game_op(game_service.get_engine, game_id)
+
+
+def json_body(model: Type[ModelT]) -> Callable:
+    """Dependency parsing the raw request body straight into a model.
+
+    model_validate_json decodes and validates in one pass in pydantic-core,
+    instead of json.loads into dicts followed by validation.
+    """
+    async def parse(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ])
+    return parse
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that parse it with json_body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+# Per-game locks serializing requests that change a game, so concurrent
+# rolls/moves on one game cannot interleave while other games proceed
+_GAME_LOCKS: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+@asynccontextmanager
+async def game_lock(game_id: str) -> AsyncIterator[None]:
+    """Hold the lock of an existing game, or raise 404."""
+    if not await run_game_op(game_service.games.__contains__, game_id):
+        raise HTTPException(status_code=404, detail="Game not found")
+    async with _GAME_LOCKS[game_id]:
+        yield
+
+
+# Handlers are async. Quick in-memory work runs on the event loop; rolling,
+# moving and AI search run in the threadpool while holding the game's lock,
+# as does every game store access when the store is Redis (run_game_op).
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint."""
     return {"message": "TABLA BAKI Backgammon API", "version": "1.0.0"}
 
 
 @app.get("/variants")
-def list_variants():
+async def list_variants():
     """List available game variants."""
     return {"variants": variant_service.list_variants()}
 
 
 @app.get("/variants/{variant_name}")
-def get_variant_rules(variant_name: str):
+async def get_variant_rules(variant_name: str):
     """Get rules for a specific variant."""
-    return variant_service.get_variant_rules(variant_name)
+    return Response(content=variant_service.get_variant_rules_json(variant_name), media_type="application/json")
 
 
-@app.post("/games", response_model=GameState)
-def create_game(game_data: GameCreate):
+@app.post("/games", response_model=GameState, openapi_extra=json_body_openapi(GameCreate))
+async def create_game(game_data: GameCreate = Depends(json_body(GameCreate))):
     """Create a new game."""
-    return game_service.create_game(game_data.variant, game_data.game_id)
+    game_id = game_data.game_id
+    if game_id and await run_game_op(game_service.games.__contains__, game_id):
+        # Replacing a running game: wait for requests still changing it
+        async with _GAME_LOCKS[game_id]:
+            return FastJSONResponse(await run_game_op(game_service.create_game, game_data.variant, game_id))
+    return FastJSONResponse(await run_game_op(game_service.create_game, game_data.variant, game_id))
 
 
 @app.get("/games/{game_id}", response_model=GameState)
-def get_game(game_id: str):
+async def get_game(
+    game_id: str,
+    legal: bool = Query(True, description="Include the legal moves of the current player"),
+):
     """Get current game state."""
-    return game_service.get_game(game_id)
+    return Response(content=await run_game_op(game_service.get_game_json, game_id, legal), media_type="application/json")
 
 
 @app.post("/games/{game_id}/roll")
-def roll_dice(game_id: str):
+async def roll_dice(game_id: str):
     """Roll dice for current player."""
-    return game_service.roll_dice(game_id)
+    async with game_lock(game_id):
+        return FastJSONResponse(await run_in_threadpool(game_service.roll_dice, game_id))
 
 
-@app.post("/games/{game_id}/move")
-def make_move(game_id: str, move_request: MoveRequest):
+@app.post("/games/{game_id}/move", openapi_extra=json_body_openapi(MoveRequest))
+async def make_move(game_id: str, move_request: MoveRequest = Depends(json_body(MoveRequest))):
     """Make a move."""
-    return game_service.make_move(
-        game_id,
-        move_request.move_type,
-        move_request.from_point,
-        move_request.to_point,
-        move_request.die_value
-    )
+    async with game_lock(game_id):
+        return FastJSONResponse(await run_in_threadpool(
+            game_service.make_move,
+            game_id,
+            move_request.move_type,
+            move_request.from_point,
+            move_request.to_point,
+            move_request.die_value
+        ))
 
 
 @app.get("/games/{game_id}/legal-moves")
-def get_legal_moves(game_id: str):
+async def get_legal_moves(engine: GameEngine = Depends(get_engine)):
     """Get legal moves for current state."""
-    game_state = game_service.get_game(game_id)
-    engine = game_service._get_engine(game_id)
-    
     if not engine.current_dice:
         return {"legal_moves": [], "message": "Roll dice first"}
     
     return {
-        "legal_moves": game_state.legal_moves,
+        "legal_moves": game_service.get_legal_moves(engine),
         "dice": engine.current_dice
     }
 
 
-@app.post("/games/{game_id}/set-player")
-def set_starting_player(game_id: str, player_data: SetPlayerRequest):
+@app.post("/games/{game_id}/set-player", openapi_extra=json_body_openapi(SetPlayerRequest))
+async def set_starting_player(game_id: str, player_data: SetPlayerRequest = Depends(json_body(SetPlayerRequest))):
     """Set the starting player."""
-    return game_service.set_starting_player(game_id, player_data.player)
+    async with game_lock(game_id):
+        return await run_game_op(game_service.set_starting_player, game_id, player_data.player)
 
 
 @app.post("/games/{game_id}/ai-move")
-def ai_make_move(game_id: str, difficulty: str = Query("medium", description="AI difficulty level")):
+async def ai_make_move(game_id: str, difficulty: str = Query("medium", description="AI difficulty level")):
     """Make an AI move for the current player."""
-    return game_service.ai_make_move(game_id, difficulty)
+    async with game_lock(game_id):
+        return FastJSONResponse(await run_in_threadpool(game_service.ai_make_move, game_id, difficulty))
 
 
 @app.delete("/games/{game_id}")
-def delete_game(game_id: str):
+async def delete_game(game_id: str):
     """Delete a game."""
-    return game_service.delete_game(game_id)
+    async with game_lock(game_id):
+        result = await run_game_op(game_service.delete_game, game_id)
+    _GAME_LOCKS.pop(game_id, None)
+    return result
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 """Base rule classes and interfaces."""
 
 from abc import ABC, abstractmethod
+from functools import partial
+from types import MappingProxyType
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
@@ -8,16 +10,55 @@ from game.board import Board, PlayerColor
 from game.move import Move, MoveType
 
 
-@dataclass
+# Read-only empty context for validation without one
+_NO_CONTEXT = MappingProxyType({})
+
+# Movement direction per color index when a variant doesn't set one:
+# white moves down the points, black up
+DEFAULT_DIRECTIONS: Tuple[int, int] = (-1, 1)
+
+
+@dataclass(frozen=True, slots=True)
 class RuleResult:
-    """Result of rule validation."""
+    """Result of rule validation.
+
+    Immutable, so rules can return shared instances for fixed outcomes.
+    Explanations that depend on the move are stored as a %-template and
+    its arguments, and only formatted when read: is_legal rejects many
+    candidates without ever looking at why.
+    """
     valid: bool
-    explanation: str
+    template: str
     rule_name: str
+    args: Tuple = ()
+
+    @property
+    def explanation(self) -> str:
+        """Human-readable explanation of the result."""
+        return self.template % self.args if self.args else self.template
+
+
+def _constant_result(result: 'RuleResult', board: Board, color: PlayerColor, move: Move,
+                     dice: Tuple[int, int], context: Dict) -> 'RuleResult':
+    """Validator of a rule whose config fixes the outcome."""
+    return result
 
 
 class Rule(ABC):
     """Base class for game rules."""
+
+    # What the rule governs ("movement", "hitting", ...); RuleSet looks up
+    # the rules it reads settings from by role
+    role: str = ""
+
+    # True when the rule accepts every normal move that goes exactly the
+    # die's distance in the color's direction and lands on a point not held
+    # by 2+ opponent pieces; lets the engine skip validating such moves
+    accepts_open_normal_moves: bool = False
+
+    # True when validate never rejects a move (it only explains); such rules
+    # are skipped by RuleSet.is_legal
+    is_noop: bool = False
     
     def __init__(self, name: str, description: str = ""):
         """Initialize rule.
@@ -58,6 +99,22 @@ class Rule(ABC):
             Explanation string
         """
         return self.description
+    
+    def bind(self, rule_set: 'RuleSet'):
+        """Called once when the rule joins a rule set.
+        
+        Rules override this to precompute settings that depend on the whole
+        set (e.g. home ranges, which follow from the movement directions).
+        """
+    
+    def fold_validate(self, result: RuleResult):
+        """Specialize validate to always return result.
+        
+        Rules call this at load time when their config makes the outcome
+        independent of the move, so validation skips all checks. A partial
+        of a module function (not a lambda) keeps rules picklable.
+        """
+        self.validate = partial(_constant_result, result)
 
 
 class RuleSet:
@@ -72,30 +129,42 @@ class RuleSet:
         """
         self.variant_name = variant_name
         self.rules = rules
+        # First rule of each role
+        self._roles: Dict[str, Rule] = {}
+        for rule in rules:
+            self._roles.setdefault(rule.role, rule)
+        # Normal moves found by the engine's board scan need no rule validation
+        self.normal_moves_prevalidated = all(rule.accepts_open_normal_moves for rule in rules)
+        self.movement_rule = self._roles.get("movement")
+        self.hitting_rule = self._roles.get("hitting")
         # Defaults
         self.doubles_uses = 4
         self.allow_combined_normal = True
         self.allow_combined_enter = False
         self.allow_combined_bear_off = False
-        self.movement_rule = None
-        self.hitting_rule = None
+        if self.movement_rule:
+            self.doubles_uses = self.movement_rule.doubles_uses
+            self.allow_combined_normal = self.movement_rule.allow_combined_normal
+            self.allow_combined_enter = self.movement_rule.allow_combined_enter
+            self.allow_combined_bear_off = self.movement_rule.allow_combined_bear_off
+        # Bear-off range per color index: with clockwise movement both colors
+        # bear off at the low end, otherwise black bears off at the high end
+        self.home_ranges: Tuple[Tuple[int, int], ...] = tuple(
+            (1, 6) if color is PlayerColor.WHITE or self.get_direction(color) == -1 else (19, 24)
+            for color in PlayerColor
+        )
         for rule in rules:
-            if hasattr(rule, "doubles_uses"):
-                self.doubles_uses = getattr(rule, "doubles_uses")
-            if hasattr(rule, "allow_combined_normal"):
-                self.allow_combined_normal = getattr(rule, "allow_combined_normal")
-                self.allow_combined_enter = getattr(rule, "allow_combined_enter")
-                self.allow_combined_bear_off = getattr(rule, "allow_combined_bear_off")
-            if hasattr(rule, "directions"):
-                self.movement_rule = rule
-            if hasattr(rule, "can_hit"):
-                self.hitting_rule = rule
+            rule.bind(self)
+        # Bound validators, resolved once after binding (rules may specialize
+        # validate); is_legal only runs those of rules that can reject a move
+        self._validators = tuple((rule.name, rule.validate) for rule in rules)
+        self._checking_validators = tuple(rule.validate for rule in rules if not rule.is_noop)
     
     def get_direction(self, color: PlayerColor) -> int:
         """Get movement direction for a color from movement rules."""
         if self.movement_rule:
-            return self.movement_rule.directions.get(color.value, -1 if color == PlayerColor.WHITE else 1)
-        return -1 if color == PlayerColor.WHITE else 1
+            return self.movement_rule.direction_by_idx[color.idx]
+        return DEFAULT_DIRECTIONS[color.idx]
     
     def can_hit(self) -> bool:
         """Check if hitting is allowed."""
@@ -109,15 +178,26 @@ class RuleSet:
             return getattr(self.hitting_rule, "pin_instead", False)
         return False
     
+    def is_legal(self, board: Board, color: PlayerColor, move: Move, dice: Tuple[int, int]) -> bool:
+        """Check a move against the rules without building explanations.
+        
+        Used by move generation; validate_move gives the same verdict along
+        with the explanation of every rule.
+        """
+        for validate in self._checking_validators:
+            if not validate(board, color, move, dice, _NO_CONTEXT).valid:
+                return False
+        return True
+    
     def validate_move(self, board: Board, color: PlayerColor, move: Move,
                      dice: Tuple[int, int], context: Dict = None) -> Tuple[bool, List[str]]:
         if context is None:
             context = {}
         
         explanations = []
-        for rule in self.rules:
-            result = rule.validate(board, color, move, dice, context)
-            explanations.append(f"{rule.name}: {result.explanation}")
+        for name, validate in self._validators:
+            result = validate(board, color, move, dice, context)
+            explanations.append(f"{name}: {result.explanation}")
             if not result.valid:
                 return False, explanations
         
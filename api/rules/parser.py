@@ -4,11 +4,15 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 
-from .base import RuleSet, Rule, RuleResult
+from .base import DEFAULT_DIRECTIONS, RuleSet, Rule, RuleResult
 from game.board import Board, PlayerColor
 from game.move import Move, MoveType
 
 
+# Default location of the variant configs (api/config/variants)
+DEFAULT_CONFIG_DIR = Path(__file__).parent.parent / "config" / "variants"
+
+
 class RuleParser:
     """Parser for rule configuration files."""
     
@@ -19,9 +23,7 @@ class RuleParser:
             config_dir: Directory containing rule config files (defaults to project root/config/variants)
         """
         if config_dir is None:
-            # Default to api/config/variants
-            api_dir = Path(__file__).parent.parent
-            self.config_dir = api_dir / "config" / "variants"
+            self.config_dir = DEFAULT_CONFIG_DIR
         else:
             self.config_dir = Path(config_dir)
     
@@ -36,12 +38,23 @@ class RuleParser:
         """
         config_file = self.config_dir / f"{variant_name}.json"
         
-        if not config_file.exists():
+        try:
+            config = json.loads(config_file.read_bytes())
+        except FileNotFoundError:
             raise FileNotFoundError(f"Rule config not found: {config_file}")
         
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        return self.build_variant(variant_name, config)
+    
+    def build_variant(self, variant_name: str, config: Dict[str, Any]) -> RuleSet:
+        """Build the rules of a variant from its already parsed config.
+        
+        Args:
+            variant_name: Name of variant (e.g., "standard")
+            config: Parsed variant config file
         
+        Returns:
+            RuleSet for the variant
+        """
         rules = []
         
         # Parse movement rules
@@ -78,11 +91,19 @@ class RuleParser:
 
 class MovementRule(Rule):
     """Rule for piece movement."""
+
+    role = "movement"
+    accepts_open_normal_moves = True
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize movement rule from config."""
         super().__init__("movement", "Piece movement rules")
         self.directions = config.get('direction', {'white': -1, 'black': 1})
+        # Direction per color index, so validation avoids a dict lookup by name
+        self.direction_by_idx: Tuple[int, ...] = tuple(
+            int(self.directions.get(color.value, DEFAULT_DIRECTIONS[color.idx]))
+            for color in PlayerColor
+        )
         self.must_use_all_dice = config.get('must_use_all_dice', True)
         # How many total moves when doubles are rolled (default 4 for standard backgammon)
         self.doubles_uses = config.get('doubles_uses', 4)
@@ -91,34 +112,45 @@ class MovementRule(Rule):
         self.allow_combined_normal = cm.get('normal', True)
         self.allow_combined_enter = cm.get('enter', False)
         self.allow_combined_bear_off = cm.get('bear_off', False)
+        self._valid = RuleResult(True, "Move is valid", self.name)
     
     def validate(self, board: Board, color: PlayerColor, move: Move,
                 dice: Tuple[int, int], context: Dict) -> RuleResult:
         """Validate movement."""
         if move.move_type == MoveType.NORMAL:
-            direction = self.directions.get(color.value, -1 if color == PlayerColor.WHITE else 1)
+            direction = self.direction_by_idx[color.idx]
             expected_target = move.from_point + (direction * move.die_value)
             
             if move.to_point != expected_target:
                 return RuleResult(
                     False,
-                    f"Move distance doesn't match die value. Expected {expected_target}, got {move.to_point}",
-                    self.name
+                    "Move distance doesn't match die value. Expected %d, got %d",
+                    self.name,
+                    (expected_target, move.to_point)
                 )
             
-            target_point = board.get_point(move.to_point)
-            if not target_point.can_land(color):
+            if not 1 <= move.to_point <= board.num_points:
+                return RuleResult(False, "Point %d is off the board", self.name, (move.to_point,))
+            
+            # Read the opponent's 2+ pieces bitboard instead of a Point view
+            if (board.ge2[color.opp_idx] >> move.to_point) & 1:
                 return RuleResult(
                     False,
-                    f"Point {move.to_point} is blocked (has 2+ opponent pieces)",
-                    self.name
+                    "Point %d is blocked (has 2+ opponent pieces)",
+                    self.name,
+                    (move.to_point,)
                 )
         
-        return RuleResult(True, "Move is valid", self.name)
+        return self._valid
 
 
 class HittingRule(Rule):
     """Rule for hitting opponent pieces."""
+
+    role = "hitting"
+    accepts_open_normal_moves = True
+    # Only explains whether a move hits
+    is_noop = True
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize hitting rule from config."""
@@ -126,76 +158,103 @@ class HittingRule(Rule):
         self.can_hit = config.get('can_hit', True)
         self.send_to_bar = config.get('send_to_bar', True)
         self.pin_instead = config.get('pin_instead', False)
+        self._not_applicable = RuleResult(True, "Hitting not applicable", self.name)
+        self._no_hit = RuleResult(True, "No hit", self.name)
+        # Without hitting, or when hits don't go to the bar, every move
+        # gets the same result
+        if not self.can_hit:
+            self.fold_validate(self._not_applicable)
+        elif not self.send_to_bar:
+            self.fold_validate(self._no_hit)
     
     def validate(self, board: Board, color: PlayerColor, move: Move,
                 dice: Tuple[int, int], context: Dict) -> RuleResult:
         """Validate hitting."""
         if not self.can_hit:
-            return RuleResult(True, "Hitting not applicable", self.name)
+            return self._not_applicable
         
         if move.move_type == MoveType.NORMAL or move.move_type == MoveType.ENTER:
-            target_point = board.get_point(move.to_point)
-            opponent = color.opposite()
-            
-            if target_point.is_blot(opponent):
+            if board.counts[color.opp_idx][move.to_point] == 1:
                 if self.send_to_bar:
                     return RuleResult(
                         True,
-                        f"Will hit opponent blot on point {move.to_point}",
-                        self.name
+                        "Will hit opponent blot on point %d",
+                        self.name,
+                        (move.to_point,)
                     )
         
-        return RuleResult(True, "No hit", self.name)
+        return self._no_hit
 
 
 class BearingOffRule(Rule):
     """Rule for bearing off pieces."""
+
+    role = "bearing_off"
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize bearing off rule from config."""
         super().__init__("bearing_off", "Bearing off pieces")
         self.enabled = config.get('enabled', True)
         self.all_in_outer_board = config.get('all_in_outer_board', True)
+        # When disabled, validate rejects every move
+        self.accepts_open_normal_moves = self.enabled
+        self._disabled = RuleResult(False, "Bearing off not enabled in this variant", self.name)
+        self._not_all_home = RuleResult(False, "All pieces must be in home board before bearing off", self.name)
+        self._valid = RuleResult(True, "Bearing off is valid", self.name)
+        if not self.enabled:
+            self.fold_validate(self._disabled)
+        self.bind_home_ranges(((1, 6), (19, 24)))
+    
+    def bind(self, rule_set: RuleSet):
+        """Take the home ranges of the rule set."""
+        self.bind_home_ranges(rule_set.home_ranges)
+    
+    def bind_home_ranges(self, home_ranges: Tuple[Tuple[int, int], ...]):
+        """Precompute home points and the out-of-home result per color index."""
+        self._home_points = tuple(frozenset(range(start, end + 1)) for start, end in home_ranges)
+        self._outside_home = tuple(
+            RuleResult(False, f"Can only bear off from points {start}-{end}", self.name)
+            for start, end in home_ranges
+        )
     
     def validate(self, board: Board, color: PlayerColor, move: Move,
                 dice: Tuple[int, int], context: Dict) -> RuleResult:
         """Validate bearing off."""
         if not self.enabled:
-            return RuleResult(False, "Bearing off not enabled in this variant", self.name)
+            return self._disabled
         
         if move.move_type == MoveType.BEAR_OFF:
             if self.all_in_outer_board:
                 if not board.can_bear_off(color):
-                    return RuleResult(
-                        False,
-                        "All pieces must be in home board before bearing off",
-                        self.name
-                    )
+                    return self._not_all_home
             
             # Check if exact die value or higher
-            home_start, home_end = board.get_bearing_off_point(color)
-            if not (home_start <= move.from_point <= home_end):
-                return RuleResult(
-                    False,
-                    f"Can only bear off from points {home_start}-{home_end}",
-                    self.name
-                )
+            if move.from_point not in self._home_points[color.idx]:
+                return self._outside_home[color.idx]
         
-        return RuleResult(True, "Bearing off is valid", self.name)
+        return self._valid
 
 
 class ForcedMoveRule(Rule):
     """Rule for forced moves."""
+
+    role = "forced_moves"
+    accepts_open_normal_moves = True
+    # Not enforced yet, see validate
+    is_noop = True
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize forced move rule from config."""
         super().__init__("forced_moves", "Forced move rules")
         self.must_use_all_dice = config.get('must_use_all_dice', True)
         self.must_use_higher_if_only_one = config.get('must_use_higher_if_only_one', True)
+        self._passed = RuleResult(True, "Forced move check passed", self.name)
+        # Not enforced yet (see validate), so the result never changes
+        self.fold_validate(self._passed)
     
     def validate(self, board: Board, color: PlayerColor, move: Move,
                 dice: Tuple[int, int], context: Dict) -> RuleResult:
         """Validate forced moves."""
         # This is simplified - full implementation would check all dice usage
-        return RuleResult(True, "Forced move check passed", self.name)
+        return self._passed
 
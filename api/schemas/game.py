@@ -1,6 +1,6 @@
 """Game-related Pydantic schemas."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Tuple
 
 
@@ -21,12 +21,20 @@ class SetPlayerRequest(BaseModel):
 
 
 class PointData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     number: int
     white_pieces: int
     black_pieces: int
 
 
 class BoardState(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    # Piece counts per point; index i holds point i + 1
+    white_pieces: List[int]
+    black_pieces: List[int]
+    # Deprecated per-point view of the same counts, kept for the current frontend
     points: List[PointData]
     bar_white: int
     bar_black: int
@@ -39,6 +47,8 @@ class BoardState(BaseModel):
 
 
 class LegalMove(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     move_type: str
     from_point: Optional[int]
     to_point: Optional[int]
@@ -46,6 +56,8 @@ class LegalMove(BaseModel):
 
 
 class GameState(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     game_id: str
     variant: str
     board: BoardState
@@ -1,6 +1,7 @@
 """Service layer for business logic."""
 
 from .game_service import GameService
+from .game_store import GameStore, InMemoryGameStore, RedisGameStore
 from .variant_service import VariantService
 
-__all__ = ["GameService", "VariantService"]
+__all__ = ["GameService", "GameStore", "InMemoryGameStore", "RedisGameStore", "VariantService"]
@@ -1,82 +1,128 @@
 """Game service for managing game state and operations."""
 
-from typing import Dict, List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException
+from pydantic_core import to_json
 
 from game.engine import GameEngine
 from game.board import PlayerColor
 from game.move import Move, MoveType
 from game.ai_agent import AIAgent
-from rules import RuleParser
 from schemas.game import GameState, BoardState, PointData, LegalMove
+from services.game_store import GameConflictError, GameStore, create_game_store
 from services.variant_service import VariantService
 
 
+# Move type names used by the API
+_MOVE_TYPE_FROM_STR = {
+    "normal": MoveType.NORMAL,
+    "enter": MoveType.ENTER,
+    "bear_off": MoveType.BEAR_OFF
+}
+_MOVE_TYPE_TO_STR = {v: k for k, v in _MOVE_TYPE_FROM_STR.items()}
+
+# Player color names used by the API (None when there is no player/winner)
+_COLOR_TO_STR = {PlayerColor.WHITE: "white", PlayerColor.BLACK: "black", None: None}
+_STR_TO_COLOR = {v: k for k, v in _COLOR_TO_STR.items() if k is not None}
+_AI_DIFFICULTIES = ("easy", "medium", "hard")
+
+
 class GameService:
     """Service for game-related operations."""
 
     def __init__(self):
-        self.games: Dict[str, GameEngine] = {}
+        self.games: GameStore = create_game_store()
         self.variant_service = VariantService()
-        self.parser = RuleParser()
+        self.parser = self.variant_service.parser
+        # Serialized game state per game, tagged with the engine state it was built from
+        self._state_cache: Dict[str, Tuple[Tuple, bytes]] = {}
+        # Processes used by the hard AI to search root moves in parallel
+        self.ai_workers = int(os.getenv("AI_WORKERS", "1"))
+        # AI agents per (game id, difficulty), kept for the lifetime of the game
+        self._ai_agents: Dict[Tuple[str, str], AIAgent] = {}
 
     def create_game(self, variant: str, game_id: Optional[str] = None) -> GameState:
         """Create a new game."""
-        if not game_id:
-            game_id = f"game_{len(self.games) + 1}"
-
-        # Load rules
-        try:
-            rules = self.parser.load_variant(variant)
-        except FileNotFoundError:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Variant '{variant}' not found"
-            )
+        # Rules are built from the variant config cached by the variant service
+        rules = self.variant_service.get_rules(variant)
 
         # Create game engine
         engine = GameEngine(rules)
 
-        # Load initial setup
-        config = self.variant_service.load_variant_config(variant)
-        initial_setup = self._parse_initial_setup(config['board']['initial_setup'])
+        # Initial setup is parsed once per variant and only read by the engine
+        initial_setup = self.variant_service.get_initial_setup(variant)
 
         engine.start_game(initial_setup)
-        self.games[game_id] = engine
+        if game_id:
+            self._save_game(game_id, engine)
+        else:
+            game_id = self._add_new_game(engine)
 
-        return self.get_game_state(game_id)
+        return self._build_game_state(game_id, engine)
 
-    def get_game(self, game_id: str) -> GameState:
+    def get_game(self, game_id: str, include_legal_moves: bool = True) -> GameState:
         """Get current game state."""
-        if game_id not in self.games:
-            raise HTTPException(status_code=404, detail="Game not found")
-        return self.get_game_state(game_id)
+        return self.get_game_state(game_id, include_legal_moves)
+
+    def get_game_json(self, game_id: str, include_legal_moves: bool = True) -> bytes:
+        """Get the current game state serialized as JSON.
+
+        The serialized state is reused until the engine state changes, so
+        repeated polling of an unchanged game skips rebuilding the models.
+        The check compares engine state rather than relying on invalidation,
+        so it also holds when other workers update a shared game store.
+
+        Args:
+            game_id: Game to describe
+            include_legal_moves: Generate the legal moves (left empty otherwise,
+                e.g. for spectators that only render the board)
+        """
+        engine = self.get_engine(game_id)
+        key = (
+            engine.rules.variant_name,
+            engine.board.zobrist_hash,
+            engine.current_player,
+            engine.get_dice_state(),
+            engine.game_over,
+            include_legal_moves,
+        )
+        cached = self._state_cache.get(game_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        legal_moves = None if include_legal_moves else []
+        body = to_json(self._build_game_state(game_id, engine, legal_moves=legal_moves))
+        self._state_cache[game_id] = (key, body)
+        return body
 
     def roll_dice(self, game_id: str) -> Dict:
         """Roll dice for current player."""
-        engine = self._get_engine(game_id)
+        engine = self.get_engine(game_id)
         self._check_game_not_over(engine)
 
         dice = engine.roll_dice()
-        legal_moves = self._get_legal_moves(engine)
+        legal_moves = self.get_legal_moves(engine)
 
         message = f"Rolled {dice[0]} and {dice[1]}."
 
         if not legal_moves and not engine.game_over:
             engine.switch_player()
-            next_player = engine.current_player.value if engine.current_player else "opponent"
+            self._save_game(game_id, engine)
+            next_player = _COLOR_TO_STR[engine.current_player] or "opponent"
             message = f"Rolled {dice[0]} and {dice[1]}. No legal moves available, turn passes to {next_player}."
             return {
                 "dice": dice,
                 "legal_moves": [],
-                "game_state": self.get_game_state(game_id),
+                "game_state": self._build_game_state(game_id, engine),
                 "message": message
             }
 
+        self._save_game(game_id, engine)
         return {
             "dice": dice,
             "legal_moves": legal_moves,
-            "game_state": self.get_game_state(game_id),
+            "game_state": self._build_game_state(game_id, engine, legal_moves=legal_moves),
             "message": message
         }
 
@@ -89,7 +135,7 @@ class GameService:
         die_value: Optional[int]
     ) -> Dict:
         """Make a move."""
-        engine = self._get_engine(game_id)
+        engine = self.get_engine(game_id)
         self._check_game_not_over(engine)
 
         if not engine.current_dice:
@@ -105,37 +151,38 @@ class GameService:
             )
 
         # Switch player if all dice used or no moves remain
-        self._handle_turn_end(engine)
+        legal_moves = self._handle_turn_end(engine)
+        self._save_game(game_id, engine)
 
         return {
             "success": True,
             "explanations": explanations,
-            "game_state": self.get_game_state(game_id)
+            "game_state": self._build_game_state(game_id, engine, legal_moves=legal_moves)
         }
 
     def ai_make_move(self, game_id: str, difficulty: str = "medium") -> Dict:
         """Make an AI move."""
-        engine = self._get_engine(game_id)
+        engine = self.get_engine(game_id)
         self._check_game_not_over(engine)
 
         if engine.current_dice is None:
             raise HTTPException(status_code=400, detail="Must roll dice first")
 
-        if difficulty not in ["easy", "medium", "hard"]:
+        if difficulty not in _AI_DIFFICULTIES:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid difficulty. Must be 'easy', 'medium', or 'hard'"
             )
 
-        ai = AIAgent(difficulty=difficulty)
-        move = ai.select_move(engine)
+        move = self._get_ai_agent(game_id, difficulty).select_move(engine)
 
         if not move:
             engine.switch_player()
+            self._save_game(game_id, engine)
             return {
                 "success": False,
                 "message": "No legal moves available",
-                "game_state": self.get_game_state(game_id)
+                "game_state": self._build_game_state(game_id, engine)
             }
 
         success, explanations = engine.make_move(move)
@@ -145,105 +192,134 @@ class GameService:
                 detail=f"AI move failed: {'; '.join(explanations)}"
             )
 
-        self._handle_turn_end(engine)
-
-        move_type_str = {
-            MoveType.NORMAL: "normal",
-            MoveType.ENTER: "enter",
-            MoveType.BEAR_OFF: "bear_off"
-        }[move.move_type]
+        legal_moves = self._handle_turn_end(engine)
+        self._save_game(game_id, engine)
 
         return {
             "success": True,
             "move": {
-                "move_type": move_type_str,
+                "move_type": _MOVE_TYPE_TO_STR[move.move_type],
                 "from_point": move.from_point,
                 "to_point": move.to_point,
                 "die_value": move.die_value
             },
             "explanations": explanations,
-            "game_state": self.get_game_state(game_id)
+            "game_state": self._build_game_state(game_id, engine, legal_moves=legal_moves)
         }
 
     def set_starting_player(self, game_id: str, player: str) -> Dict:
         """Set the starting player."""
-        engine = self._get_engine(game_id)
+        engine = self.get_engine(game_id)
         player_str = player.lower()
 
-        if player_str == "white":
-            engine.current_player = PlayerColor.WHITE
-        elif player_str == "black":
-            engine.current_player = PlayerColor.BLACK
-        else:
+        color = _STR_TO_COLOR.get(player_str)
+        if color is None:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid player. Must be 'white' or 'black'"
             )
+        engine.current_player = color
+        self._save_game(game_id, engine)
 
         return {
             "message": f"Starting player set to {player_str}",
-            "game_state": self.get_game_state(game_id)
+            "game_state": self._build_game_state(game_id, engine)
         }
 
     def delete_game(self, game_id: str) -> Dict:
         """Delete a game."""
-        if game_id not in self.games:
+        self._state_cache.pop(game_id, None)
+        for difficulty in _AI_DIFFICULTIES:
+            self._ai_agents.pop((game_id, difficulty), None)
+        if not self.games.delete(game_id):
             raise HTTPException(status_code=404, detail="Game not found")
-        del self.games[game_id]
         return {"message": "Game deleted"}
 
-    def get_game_state(self, game_id: str) -> GameState:
-        """Get game state."""
-        engine = self._get_engine(game_id)
-
-        points = []
-        for i in range(1, engine.board.num_points + 1):
-            point = engine.board.get_point(i)
-            points.append(PointData(
-                number=i,
-                white_pieces=point.get_pieces(PlayerColor.WHITE),
-                black_pieces=point.get_pieces(PlayerColor.BLACK)
-            ))
+    def get_game_state(self, game_id: str, include_legal_moves: bool = True) -> GameState:
+        """Get game state, with empty legal moves unless include_legal_moves is set."""
+        legal_moves = None if include_legal_moves else []
+        return self._build_game_state(game_id, self.get_engine(game_id), legal_moves=legal_moves)
 
-        board_state = BoardState(
+    def _build_game_state(
+        self,
+        game_id: str,
+        engine: GameEngine,
+        legal_moves: Optional[List[LegalMove]] = None
+    ) -> GameState:
+        """Build the game state of an engine.
+
+        Models are built with model_construct: every value comes from the
+        engine already typed, so per-field validation would only repeat work.
+
+        Args:
+            game_id: Game to describe
+            engine: Engine of the game
+            legal_moves: Legal moves already computed for the current state
+        """
+
+        white_pieces, black_pieces = engine.board.snapshot()
+        bar_white, bar_black, borne_off_white, borne_off_black = engine.board.summary()
+        points = [
+            PointData.model_construct(number=i, white_pieces=w, black_pieces=b)
+            for i, (w, b) in enumerate(zip(white_pieces, black_pieces), start=1)
+        ]
+
+        board_state = BoardState.model_construct(
+            white_pieces=white_pieces,
+            black_pieces=black_pieces,
             points=points,
-            bar_white=engine.board.get_bar_count(PlayerColor.WHITE),
-            bar_black=engine.board.get_bar_count(PlayerColor.BLACK),
-            borne_off_white=engine.board.borne_off[PlayerColor.WHITE],
-            borne_off_black=engine.board.borne_off[PlayerColor.BLACK],
-            current_player=engine.current_player.value if engine.current_player else None,
+            bar_white=bar_white,
+            bar_black=bar_black,
+            borne_off_white=borne_off_white,
+            borne_off_black=borne_off_black,
+            current_player=_COLOR_TO_STR[engine.current_player],
             dice=engine.current_dice,
             game_over=engine.game_over,
-            winner=engine.winner.value if engine.winner else None
+            winner=_COLOR_TO_STR[engine.winner]
         )
 
-        return GameState(
+        return GameState.model_construct(
             game_id=game_id,
             variant=engine.rules.variant_name,
             board=board_state,
-            legal_moves=self._get_legal_moves(engine),
+            legal_moves=legal_moves if legal_moves is not None else self.get_legal_moves(engine),
             can_roll=not engine.game_over and engine.current_dice is None
         )
 
-    def _get_engine(self, game_id: str) -> GameEngine:
+    def get_engine(self, game_id: str) -> GameEngine:
         """Get game engine or raise 404."""
-        if game_id not in self.games:
+        engine = self.games.get(game_id)
+        if engine is None:
             raise HTTPException(status_code=404, detail="Game not found")
-        return self.games[game_id]
+        return engine
+
+    def _get_ai_agent(self, game_id: str, difficulty: str) -> AIAgent:
+        """Get the AI agent of a game for a difficulty, creating it on first use."""
+        key = (game_id, difficulty)
+        agent = self._ai_agents.get(key)
+        if agent is None:
+            agent = self._ai_agents[key] = AIAgent(difficulty=difficulty, workers=self.ai_workers)
+        return agent
+
+    def _add_new_game(self, engine: GameEngine) -> str:
+        """Store a new game under a generated id, skipping ids already taken (e.g. chosen by clients)."""
+        while True:
+            game_id = self.games.next_id()
+            if self.games.add(game_id, engine):
+                return game_id
+
+    def _save_game(self, game_id: str, engine: GameEngine):
+        """Store a changed game, or raise 409 if another worker changed it meanwhile."""
+        try:
+            self.games.set(game_id, engine)
+        except GameConflictError as exc:
+            raise HTTPException(status_code=409, detail=f"{exc}; reload the game and retry")
 
     def _check_game_not_over(self, engine: GameEngine):
         """Check if game is not over."""
         if engine.game_over:
             raise HTTPException(status_code=400, detail="Game is over")
 
-    def _parse_initial_setup(self, setup: Dict) -> Dict[PlayerColor, Dict[int, int]]:
-        """Parse initial setup from config."""
-        initial_setup = {}
-        for color_str, positions in setup.items():
-            color = PlayerColor.WHITE if color_str == "white" else PlayerColor.BLACK
-            initial_setup[color] = {int(k): v for k, v in positions.items()}
-        return initial_setup
-
     def _create_move(
         self,
         engine: GameEngine,
@@ -253,13 +329,7 @@ class GameService:
         die_value: Optional[int]
     ) -> Move:
         """Create a Move object from request data."""
-        move_type_map = {
-            "normal": MoveType.NORMAL,
-            "enter": MoveType.ENTER,
-            "bear_off": MoveType.BEAR_OFF
-        }
-
-        move_type_enum = move_type_map.get(move_type)
+        move_type_enum = _MOVE_TYPE_FROM_STR.get(move_type)
         if not move_type_enum:
             raise HTTPException(
                 status_code=400,
@@ -274,36 +344,32 @@ class GameService:
             die_value=die_value or 0
         )
 
-    def _handle_turn_end(self, engine: GameEngine):
-        """Handle turn end logic."""
-        if not engine.game_over:
-            if not engine.has_remaining_moves():
-                engine.switch_player()
-            else:
-                remaining_moves = engine.get_legal_moves()
-                if not remaining_moves:
-                    engine.switch_player()
-
-    def _get_legal_moves(self, engine: GameEngine) -> List[LegalMove]:
+    def _handle_turn_end(self, engine: GameEngine) -> Optional[List[LegalMove]]:
+        """Handle turn end logic.
+
+        Returns the legal moves of the resulting state so callers can reuse
+        them for the response, or None once the game is over.
+        """
+        if engine.game_over:
+            return None
+        if engine.has_remaining_moves():
+            remaining_moves = self.get_legal_moves(engine)
+            if remaining_moves:
+                return remaining_moves
+        engine.switch_player()
+        return []
+
+    def get_legal_moves(self, engine: GameEngine) -> List[LegalMove]:
         """Get legal moves for engine."""
         if not engine.current_dice:
             return []
 
-        moves = engine.get_legal_moves()
-        result = []
-
-        for move in moves:
-            move_type_str = {
-                MoveType.NORMAL: "normal",
-                MoveType.ENTER: "enter",
-                MoveType.BEAR_OFF: "bear_off"
-            }[move.move_type]
-
-            result.append(LegalMove(
-                move_type=move_type_str,
+        return [
+            LegalMove.model_construct(
+                move_type=_MOVE_TYPE_TO_STR[move.move_type],
                 from_point=move.from_point,
                 to_point=move.to_point,
                 die_value=move.die_value
-            ))
-
-        return result
+            )
+            for move in engine.get_legal_moves()
+        ]
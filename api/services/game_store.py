@@ -0,0 +1,195 @@
+"""Storage backends for running games."""
+
+import itertools
+import os
+import pickle
+import weakref
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from game.engine import GameEngine
+
+
+# Sequence for generated game ids; never reuses an id after a game is deleted
+_GAME_ID_COUNTER = itertools.count(1)
+
+
+class GameConflictError(Exception):
+    """Raised when a game was changed or deleted by another request since it was read."""
+
+    def __init__(self, game_id: str):
+        super().__init__(f"Game '{game_id}' was changed by another request")
+        self.game_id = game_id
+
+
+class GameStore(ABC):
+    """Interface for storing game engines by game id.
+
+    Engines are mutated in place by the game service; call ``set`` after a
+    change so stores that keep a serialized copy see the new state.
+    """
+
+    # True when calls wait on the network, so async code must not make them
+    # on the event loop
+    blocking = False
+
+    @abstractmethod
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        """Get the engine of a game, or None if it does not exist."""
+        pass
+
+    @abstractmethod
+    def set(self, game_id: str, engine: GameEngine):
+        """Store (or update) the engine of a game.
+
+        Raises:
+            GameConflictError: If the engine was read from the store and the
+                stored game changed since (only stores shared between
+                processes can detect this)
+        """
+        pass
+
+    @abstractmethod
+    def add(self, game_id: str, engine: GameEngine) -> bool:
+        """Store a new game. Returns False if the id is already taken."""
+        pass
+
+    @abstractmethod
+    def next_id(self) -> str:
+        """Generate a game id that no other caller of this store gets."""
+        pass
+
+    @abstractmethod
+    def delete(self, game_id: str) -> bool:
+        """Delete a game. Returns False if it did not exist."""
+        pass
+
+    def __contains__(self, game_id: str) -> bool:
+        return self.get(game_id) is not None
+
+    def close(self):
+        """Release connections held by the store."""
+        pass
+
+
+class InMemoryGameStore(GameStore):
+    """Process-local store backed by a dict (the default)."""
+
+    def __init__(self):
+        self._games: Dict[str, GameEngine] = {}
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        return self._games.get(game_id)
+
+    def set(self, game_id: str, engine: GameEngine):
+        self._games[game_id] = engine
+
+    def add(self, game_id: str, engine: GameEngine) -> bool:
+        return self._games.setdefault(game_id, engine) is engine
+
+    def next_id(self) -> str:
+        return f"game_{next(_GAME_ID_COUNTER)}"
+
+    def delete(self, game_id: str) -> bool:
+        return self._games.pop(game_id, None) is not None
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+
+class RedisGameStore(GameStore):
+    """Store shared between API workers, keeping pickled engines in Redis.
+
+    Requires the ``redis`` package. Games expire after ``ttl`` seconds
+    without an update. Calls block on Redis round trips (see ``blocking``).
+
+    Each game is a hash of the pickled engine and a version that every write
+    increments. ``set`` only writes an engine read by ``get`` if the version
+    is still the one it was read at, so concurrent requests on different
+    workers cannot silently overwrite each other; the loser gets a
+    GameConflictError. Ids come from an atomic counter in Redis.
+    """
+
+    blocking = True
+
+    KEY_PREFIX = "tabla_baki:game:"
+    ID_COUNTER_KEY = "tabla_baki:next_game_id"
+
+    def __init__(self, url: str, ttl: int = 24 * 60 * 60):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self._watch_error = redis.WatchError
+        # Stored version each engine was read at, dropped with the engine
+        self._versions: "weakref.WeakKeyDictionary[GameEngine, int]" = weakref.WeakKeyDictionary()
+
+    def get(self, game_id: str) -> Optional[GameEngine]:
+        data, version = self.client.hmget(self.KEY_PREFIX + game_id, "engine", "version")
+        if data is None:
+            return None
+        engine = pickle.loads(data)
+        self._versions[engine] = int(version)
+        return engine
+
+    def set(self, game_id: str, engine: GameEngine):
+        key = self.KEY_PREFIX + game_id
+        # None for engines not read from the store, e.g. a new game replacing one
+        expected = self._versions.get(engine)
+        data = pickle.dumps(engine)
+        try:
+            with self.client.pipeline() as pipe:
+                pipe.watch(key)
+                current = pipe.hget(key, "version")
+                current = int(current) if current is not None else 0
+                if expected is not None and current != expected:
+                    raise GameConflictError(game_id)
+                pipe.multi()
+                pipe.hset(key, mapping={"engine": data, "version": current + 1})
+                pipe.expire(key, self.ttl)
+                pipe.execute()
+        except self._watch_error:
+            raise GameConflictError(game_id)
+        self._versions[engine] = current + 1
+
+    def add(self, game_id: str, engine: GameEngine) -> bool:
+        key = self.KEY_PREFIX + game_id
+        data = pickle.dumps(engine)
+        try:
+            with self.client.pipeline() as pipe:
+                pipe.watch(key)
+                if pipe.exists(key):
+                    return False
+                pipe.multi()
+                pipe.hset(key, mapping={"engine": data, "version": 1})
+                pipe.expire(key, self.ttl)
+                pipe.execute()
+        except self._watch_error:
+            return False
+        self._versions[engine] = 1
+        return True
+
+    def next_id(self) -> str:
+        return f"game_{self.client.incr(self.ID_COUNTER_KEY)}"
+
+    def delete(self, game_id: str) -> bool:
+        return self.client.delete(self.KEY_PREFIX + game_id) > 0
+
+    def __contains__(self, game_id: str) -> bool:
+        return self.client.exists(self.KEY_PREFIX + game_id) > 0
+
+    def close(self):
+        self.client.close()
+
+
+def create_game_store() -> GameStore:
+    """Create the game store configured by the environment.
+
+    Uses Redis when GAME_STORE_URL is set (e.g. ``redis://localhost:6379/0``),
+    otherwise keeps games in process memory.
+    """
+    url = os.getenv("GAME_STORE_URL")
+    if url:
+        ttl = int(os.getenv("GAME_STORE_TTL", str(24 * 60 * 60)))
+        return RedisGameStore(url, ttl=ttl)
+    return InMemoryGameStore()
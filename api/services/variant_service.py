@@ -1,43 +1,133 @@
 """Variant service for managing game variants."""
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Tuple
 from fastapi import HTTPException
 
+from game.board import PlayerColor
 from rules import RuleParser
+from rules.base import RuleSet
+
+
+# Variant configs are static files, so one parser and one scan of the
+# config directory serve every request
+_PARSER = RuleParser()
+
+
+@lru_cache(maxsize=1)
+def _variant_names() -> Tuple[str, ...]:
+    """Sorted names of the available variants."""
+    return tuple(_PARSER.list_variants())
+
+
+@lru_cache(maxsize=1)
+def _variant_name_set() -> frozenset:
+    """Set of available variant names for membership checks."""
+    return frozenset(_variant_names())
+
+
+class _VariantConfig(NamedTuple):
+    """A variant config file in the forms the services need."""
+    raw: bytes  # File contents, served as-is by the rules endpoint
+    config: Dict[str, Any]
+    initial_setup: Dict[PlayerColor, Dict[int, int]]
+
+
+@lru_cache(maxsize=32)
+def _load_variant_config(variant_name: str) -> _VariantConfig:
+    """Read a variant config once, parse it and pre-build its initial board setup.
+
+    Raises:
+        FileNotFoundError: If the variant has no config file (not cached)
+    """
+    raw = (_PARSER.config_dir / f"{variant_name}.json").read_bytes()
+    config = json.loads(raw)
+    return _VariantConfig(raw, config, _parse_initial_setup(config['board']['initial_setup']))
+
+
+def _parse_initial_setup(setup: Dict) -> Dict[PlayerColor, Dict[int, int]]:
+    """Parse initial setup from config."""
+    initial_setup = {}
+    for color_str, positions in setup.items():
+        color = PlayerColor.WHITE if color_str == "white" else PlayerColor.BLACK
+        initial_setup[color] = {int(k): v for k, v in positions.items()}
+    return initial_setup
 
 
 class VariantService:
     """Service for variant-related operations."""
 
     def __init__(self):
-        self.parser = RuleParser()
+        self.parser = _PARSER
         self.api_dir = Path(__file__).parent.parent
 
-    def list_variants(self) -> List[str]:
-        """List all available variants."""
-        return self.parser.list_variants()
+    def list_variants(self, reload: bool = False) -> List[str]:
+        """List all available variants.
+
+        Args:
+            reload: Rescan the config directory and drop cached configs,
+                e.g. after variant files were added or edited
+        """
+        if reload:
+            _variant_names.cache_clear()
+            _variant_name_set.cache_clear()
+            _load_variant_config.cache_clear()
+        return list(_variant_names())
+
+    def preload(self):
+        """Read and parse every variant config up front.
+
+        Called at startup so the first request for each variant does not pay
+        for the file read and JSON parse.
+        """
+        for variant_name in _variant_names():
+            _load_variant_config(variant_name)
 
     def get_variant_rules(self, variant_name: str) -> Dict[str, Any]:
-        """Get rules for a specific variant."""
-        if variant_name not in self.list_variants():
+        """Get rules for a specific variant.
+
+        The returned config is shared between calls and must not be modified.
+        """
+        self._check_variant(variant_name)
+        return self._get_cached_config(variant_name).config
+
+    def get_variant_rules_json(self, variant_name: str) -> bytes:
+        """Get the rules of a variant as the JSON bytes of its config file."""
+        self._check_variant(variant_name)
+        return self._get_cached_config(variant_name).raw
+
+    def load_variant_config(self, variant_name: str) -> Dict[str, Any]:
+        """Load variant configuration file."""
+        return copy.deepcopy(self._get_cached_config(variant_name).config)
+
+    def get_rules(self, variant_name: str) -> RuleSet:
+        """Build the rules of a variant from its cached config."""
+        return self.parser.build_variant(variant_name, self._get_cached_config(variant_name).config)
+
+    def get_initial_setup(self, variant_name: str) -> Dict[PlayerColor, Dict[int, int]]:
+        """Get the parsed initial board setup of a variant.
+
+        The returned mapping is shared between calls and must not be modified.
+        """
+        return self._get_cached_config(variant_name).initial_setup
+
+    def _check_variant(self, variant_name: str):
+        """Raise 404 if the variant does not exist."""
+        if variant_name not in _variant_name_set():
             raise HTTPException(
                 status_code=404,
                 detail=f"Variant '{variant_name}' not found"
             )
 
-        config_file = self.api_dir / "config" / "variants" / f"{variant_name}.json"
-        with open(config_file, 'r') as f:
-            return json.load(f)
-
-    def load_variant_config(self, variant_name: str) -> Dict[str, Any]:
-        """Load variant configuration file."""
-        config_file = self.api_dir / "config" / "variants" / f"{variant_name}.json"
-        if not config_file.exists():
+    def _get_cached_config(self, variant_name: str) -> _VariantConfig:
+        """Get the cached variant config or raise 404."""
+        try:
+            return _load_variant_config(variant_name)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail=f"Variant '{variant_name}' not found"
             )
-        with open(config_file, 'r') as f:
-            return json.load(f)
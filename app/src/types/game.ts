@@ -7,6 +7,10 @@ export interface PointData {
 }
 
 export interface BoardState {
+  // Piece counts per point; index i holds point i + 1
+  white_pieces: number[];
+  black_pieces: number[];
+  /** @deprecated Per-point view of white_pieces/black_pieces */
   points: PointData[];
   bar_white: number;
   bar_black: number;
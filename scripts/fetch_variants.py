@@ -25,63 +25,152 @@ added later if needed.
 
 from __future__ import annotations
 
+import argparse
+import email.utils
+import hashlib
+import http.client
+import io
 import json
+import math
+import multiprocessing
+import random
 import re
 import sys
+import textwrap
+import threading
+import time
+import urllib.error
 import urllib.parse
-import urllib.request
-from dataclasses import dataclass
+import urllib.robotparser
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import partial
+from html import unescape
 from html.parser import HTMLParser
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
 BASE_INDEX = "https://www.bkgm.com/variants/"
 
+# Variant pages are fetched concurrently; fetching is bound by network
+# round trips, so threads overlap the waits
+FETCH_WORKERS = 16
+FETCH_TIMEOUT = 30
+MAX_REDIRECTS = 5
+USER_AGENT = "TABLA_BAKI fetch_variants"
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+# Pages at least this big are parsed in a process pool, where parsing is
+# not serialized by the GIL; smaller ones are not worth sending over and
+# are scanned with regexes in the fetching thread
+PARSE_IN_PROCESS_BYTES = 32_000
+_PARSE_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+# Pages kept between runs (see PageCache); relative to the working directory
+DEFAULT_CACHE_DIR = Path(".cache") / "fetch_variants"
+# Pages are read up to this size; anything longer is not a variant page
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Requests per second to the variant site, shared by all workers; lowered
+# further when robots.txt sets a Crawl-delay
+REQUESTS_PER_SECOND = 4.0
+
+# Transient failures are retried with capped exponential backoff and full
+# jitter, so workers hitting a rate limit together don't retry in lockstep
+FETCH_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.25
+MAX_RETRY_AFTER = 60.0
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+_WS_RE = re.compile(r"\s+")
+# Markup the regex scan of small pages drops: comments, scripts and styles
+# with their content, then tags, declarations and processing instructions
+# (a "<" not followed by a tag name stays text, as in HTMLParser)
+_HIDDEN_RE = re.compile(r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"</?[A-Za-z][^>]*>|<![^>]*>|<\?[^>]*>")
+# Names made of letters and spaces only, like "Plakoto" or "Russian Backgammon"
+_CLEAR_NAME_RE = re.compile(r"[A-Za-z]+(?: [A-Za-z]+)*")
+_TITLE_RE = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+_TITLE_CLEAN_RE = re.compile(r"Backgammon Galore!|\s*Backgammon\s*Variants?", re.IGNORECASE)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a page URL, so one page is only fetched once.
+
+    Lowercases the scheme and host and drops the fragment, which never
+    reaches the server; urljoin has already resolved ./ and ../ segments.
+    """
+    parts = urllib.parse.urlsplit(url)
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
 
 class LinkExtractor(HTMLParser):
     def __init__(self, base_url: str):
         super().__init__()
         self.base_url = base_url
         self.links: List[str] = []
+        self._seen: Set[str] = set()
 
     def handle_starttag(self, tag, attrs):
         if tag != "a":
             return
-        href = dict(attrs).get("href")
+        # Scan the (name, value) pairs rather than building a dict per tag
+        for name, href in attrs:
+            if name == "href":
+                break
+        else:
+            return
         if not href:
             return
+        full = normalize_url(urllib.parse.urljoin(self.base_url, href))
         # Only keep links that look like variant pages (html files).
-        if href.lower().endswith(".html"):
-            full = urllib.parse.urljoin(self.base_url, href)
-            if full not in self.links:
+        if urllib.parse.urlsplit(full).path.lower().endswith(".html"):
+            if full not in self._seen:
+                self._seen.add(full)
                 self.links.append(full)
 
 
 class TextExtractor(HTMLParser):
+    """Collects the visible text and the <title> of a page in one pass."""
+
     def __init__(self):
         super().__init__()
-        self.text_parts: List[str] = []
+        self._text = io.StringIO()
+        self.title_parts: List[str] = []
+        self.title: Optional[str] = None
         self.in_script_or_style = False
+        self.in_title = False
 
     def handle_starttag(self, tag, attrs):
         if tag in ("script", "style"):
             self.in_script_or_style = True
+        elif tag == "title":
+            self.in_title = True
 
     def handle_endtag(self, tag):
         if tag in ("script", "style"):
             self.in_script_or_style = False
+        elif tag == "title" and self.in_title:
+            self.in_title = False
+            # Only the first title counts, like a search for <title> would
+            if self.title is None:
+                self.title = "".join(self.title_parts).strip()
 
     def handle_data(self, data):
         if self.in_script_or_style:
             return
+        if self.in_title:
+            self.title_parts.append(data)
         text = data.strip()
         if text:
-            self.text_parts.append(text)
+            self._text.write(text)
+            self._text.write(" ")
 
     def get_text(self) -> str:
-        return " ".join(self.text_parts)
+        return self._text.getvalue().rstrip()
 
 
-@dataclass
+@dataclass(slots=True)
 class VariantEntry:
     name: str
     source_url: str
@@ -97,28 +186,250 @@ class VariantEntry:
     special_rules: str = ""
     notes: str = ""
 
-    def to_dict(self):
-        return {
-            "name": self.name,
-            "source_url": self.source_url,
-            "setup": self.setup,
-            "movement": self.movement,
-            "dice": self.dice,
-            "hitting": self.hitting,
-            "bar_enter": self.bar_enter,
-            "forced_moves": self.forced_moves,
-            "combined_moves": self.combined_moves,
-            "bearing_off": self.bearing_off,
-            "win_condition": self.win_condition,
-            "special_rules": self.special_rules,
-            "notes": self.notes,
-        }
-
-
-def fetch(url: str) -> str:
-    with urllib.request.urlopen(url) as resp:
+
+class ConnectionPool:
+    """Keep-alive HTTP connections, one per thread and host.
+
+    All variant pages are on one host, so reusing the connection pays the
+    TCP and TLS handshakes once per worker instead of once per page.
+    """
+
+    def __init__(self, timeout: float = FETCH_TIMEOUT):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connections: Dict[Tuple[int, str, str], http.client.HTTPConnection] = {}
+
+    def get(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        key = (threading.get_ident(), scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = cls(netloc, timeout=self.timeout)
+            with self._lock:
+                self._connections[key] = conn
+        return conn
+
+    def close(self):
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
+
+_POOL = ConnectionPool()
+
+
+class RateLimiter:
+    """Token bucket shared by the fetch workers.
+
+    Allows rate requests per second on average, in bursts of up to burst.
+    Callers reserve a token under the lock and sleep outside it until their
+    slot, so waiting workers go in turn.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back all workers for seconds, e.g. after a 429 response."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class PageCache:
+    """Fetched pages kept on disk by URL, revalidated with conditional GETs.
+
+    Each page is stored as <sha1(url)>.html next to a .meta.json with the
+    ETag and Last-Modified headers it was served with.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.html", self.directory / f"{key}.meta.json"
+
+    def load(self, url: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Return the cached page and its validator headers, if any."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return body_path.read_text(encoding="utf-8"), meta
+        except (OSError, ValueError):
+            return None
+
+    def save(self, url: str, text: str, headers: http.client.HTTPMessage):
+        meta = {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+        body_path, meta_path = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body_path.write_text(text, encoding="utf-8")
+        # Written last, so a page is only used once it was saved in full
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _request(url: str, headers: Dict[str, str],
+             content_types: Optional[frozenset] = HTML_CONTENT_TYPES) -> Tuple[http.client.HTTPResponse, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conn = _POOL.get(parts.scheme, parts.netloc)
+    try:
+        return _send(conn, path, headers, content_types)
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        # The server may have closed the kept-alive connection while it was
+        # idle; send once more on a fresh one
+        conn.close()
+        return _send(conn, path, headers, content_types)
+
+
+def _send(conn: http.client.HTTPConnection, path: str, headers: Dict[str, str],
+          content_types: Optional[frozenset]) -> Tuple[http.client.HTTPResponse, bytes]:
+    try:
+        conn.request("GET", path, headers={"User-Agent": USER_AGENT, **headers})
+        resp = conn.getresponse()
+        # Skip linked PDFs, images and the like before reading their body
+        if content_types and 200 <= resp.status < 300 and resp.getheader("Content-Type"):
+            content_type = resp.headers.get_content_type()
+            if content_type not in content_types:
+                raise ValueError(f"Not an HTML page: {content_type}")
+        length = resp.getheader("Content-Length")
+        if length and length.isdigit() and int(length) > MAX_PAGE_BYTES:
+            raise ValueError(f"Page too large: {length} bytes")
+        body = resp.read(MAX_PAGE_BYTES + 1)
+    except BaseException:
+        # A failed exchange (e.g. a read timeout) leaves the connection
+        # mid-request; close it so the next request on it reconnects
+        conn.close()
+        raise
+    if len(body) > MAX_PAGE_BYTES:
+        # The rest of the body is still on the connection, so drop it
+        conn.close()
+        body = body[:MAX_PAGE_BYTES]
+    return resp, body
+
+
+def fetch(url: str, cache: Optional[PageCache] = None, limiter: Optional[RateLimiter] = None,
+          content_types: Optional[frozenset] = HTML_CONTENT_TYPES) -> str:
+    cached = cache.load(url) if cache else None
+    headers = {}
+    if cached:
+        meta = cached[1]
+        if "ETag" in meta:
+            headers["If-None-Match"] = meta["ETag"]
+        if "Last-Modified" in meta:
+            headers["If-Modified-Since"] = meta["Last-Modified"]
+
+    page_url = url
+    for _ in range(MAX_REDIRECTS + 1):
+        if limiter:
+            limiter.acquire()
+        resp, body = _request(page_url, headers, content_types)
+        if resp.status == 304 and cached:
+            return cached[0]
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            page_url = urllib.parse.urljoin(page_url, location)
+            # The validators belong to the cached page, not the new location
+            headers = {}
+            continue
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(page_url, resp.status, resp.reason, resp.headers, None)
         charset = resp.headers.get_content_charset() or "utf-8"
-        return resp.read().decode(charset, errors="replace")
+        text = body.decode(charset, errors="replace")
+        if cache:
+            cache.save(url, text, resp.headers)
+        return text
+    raise urllib.error.URLError(f"Too many redirects: {url}")
+
+
+def _retry_after(err: urllib.error.HTTPError) -> Optional[float]:
+    value = err.headers.get("Retry-After") if err.headers else None
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def fetch_with_retry(url: str, attempts: int = FETCH_ATTEMPTS, base: float = RETRY_BASE_DELAY,
+                     cache: Optional[PageCache] = None, limiter: Optional[RateLimiter] = None) -> str:
+    """Fetch a page, retrying on 408/429/5xx responses and connection errors.
+
+    Waits random.uniform(0, base * 2**n) before retry n, or the server's
+    Retry-After when it sends one. A Retry-After on 429 also pauses the
+    limiter, so the other workers back off too. The last error is raised
+    once all attempts have failed.
+    """
+    for n in range(attempts):
+        delay = None
+        try:
+            return fetch(url, cache, limiter)
+        except urllib.error.HTTPError as exc:
+            if exc.code not in RETRY_STATUSES or n == attempts - 1:
+                raise
+            delay = _retry_after(exc)
+            if exc.code == 429 and delay and limiter:
+                limiter.pause(delay)
+                delay = 0.0
+        except urllib.error.URLError:
+            raise
+        except (OSError, http.client.HTTPException):
+            if n == attempts - 1:
+                raise
+        if delay is None:
+            delay = random.uniform(0, base * 2 ** n)
+        time.sleep(delay)
+    raise ValueError("attempts must be at least 1")
+
+
+def load_robots(base_url: str) -> urllib.robotparser.RobotFileParser:
+    """Read the robots.txt of the site of base_url.
+
+    Follows redirects and treats failures like RobotFileParser.read: a
+    401/403 disallows everything and any other 4xx allows everything. A 5xx
+    or an unreachable file leaves the parser unread, so nothing may be
+    fetched.
+    """
+    robots_url = urllib.parse.urljoin(base_url, "/robots.txt")
+    robots = urllib.robotparser.RobotFileParser(robots_url)
+    try:
+        text = fetch(robots_url, content_types=None)
+    except urllib.error.HTTPError as exc:
+        if exc.code in (401, 403):
+            robots.disallow_all = True
+        elif 400 <= exc.code < 500:
+            robots.allow_all = True
+        return robots
+    except (OSError, http.client.HTTPException, ValueError):
+        return robots
+    robots.parse(text.splitlines())
+    return robots
 
 
 def extract_links(index_html: str) -> List[str]:
@@ -127,13 +438,41 @@ def extract_links(index_html: str) -> List[str]:
     return parser.links
 
 
-def extract_text(html: str) -> str:
+class VariantEncoder(json.JSONEncoder):
+    """Encodes VariantEntry (and other dataclasses) as JSON objects."""
+
+    def default(self, o):
+        if is_dataclass(o):
+            return asdict(o)
+        return super().default(o)
+
+
+def parse_page(html: str) -> Tuple[Optional[str], str]:
+    """Parse a page once into its title (None without one) and its text."""
     parser = TextExtractor()
     parser.feed(html)
     text = parser.get_text()
     # Collapse excessive whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    text = _WS_RE.sub(" ", text).strip()
+    return parser.title, text
+
+
+def scan_page(html: str, with_title: bool = True) -> Tuple[Optional[str], str]:
+    """Regex version of parse_page for small, well-formed pages.
+
+    Gives the same title and text as parse_page on typical pages without
+    running HTMLParser's per-tag callbacks. with_title=False skips the
+    search for the title and returns None for it.
+    """
+    visible = _HIDDEN_RE.sub(" ", html)
+    title_match = _TITLE_RE.search(visible) if with_title else None
+    title = unescape(title_match.group(1)).strip() if title_match else None
+    text = unescape(_TAG_RE.sub(" ", visible))
+    return title, _WS_RE.sub(" ", text).strip()
+
+
+def extract_text(html: str) -> str:
+    return parse_page(html)[1]
 
 
 def infer_name_from_url(url: str) -> str:
@@ -144,52 +483,128 @@ def infer_name_from_url(url: str) -> str:
     return name.replace("-", " ").replace("_", " ").title()
 
 
-def main(output_path: Optional[str] = None):
-    print("Fetching index...", file=sys.stderr)
-    index_html = fetch(BASE_INDEX)
-    links = extract_links(index_html)
-    print(f"Found {len(links)} variant links", file=sys.stderr)
-
-    variants: List[VariantEntry] = []
-    for link in links:
-        try:
-            page_html = fetch(link)
-            text = extract_text(page_html)
-            name_match = re.search(r"<title>(.*?)</title>", page_html, re.IGNORECASE | re.DOTALL)
-            if name_match:
-                title = name_match.group(1).strip()
-                # Clean common suffixes
-                title = re.sub(r"Backgammon Galore!|\s*Backgammon\s*Variants?", "", title, flags=re.IGNORECASE).strip(" -|")
-                name = title if title else infer_name_from_url(link)
+def is_clear_name(name: str) -> bool:
+    """Whether a name taken from a URL reads as a game name as it is."""
+    return len(name) >= 4 and _CLEAR_NAME_RE.fullmatch(name) is not None
+
+
+def fetch_variant(link: str, cache: Optional[PageCache] = None,
+                  parse_pool: Optional[Executor] = None,
+                  limiter: Optional[RateLimiter] = None,
+                  prefer_url_name: bool = False) -> VariantEntry:
+    try:
+        page_html = fetch_with_retry(link, cache=cache, limiter=limiter)
+        # Most variant pages are named after the game, so the page title is
+        # only needed when the file name doesn't read as one
+        url_name = infer_name_from_url(link) if prefer_url_name else ""
+        use_url_name = prefer_url_name and is_clear_name(url_name)
+        if len(page_html) < PARSE_IN_PROCESS_BYTES:
+            title, text = scan_page(page_html, with_title=not use_url_name)
+        elif parse_pool is not None:
+            title, text = parse_pool.submit(parse_page, page_html).result()
+        else:
+            title, text = parse_page(page_html)
+        if use_url_name:
+            name = url_name
+        elif title is not None:
+            # Clean common suffixes
+            title = _TITLE_CLEAN_RE.sub("", title).strip(" -|")
+            name = title if title else infer_name_from_url(link)
+        else:
+            name = infer_name_from_url(link)
+
+        print(f"Fetched: {name}", file=sys.stderr)
+        return VariantEntry(
+            name=name,
+            source_url=link,
+            notes=text,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to fetch {link}: {exc}", file=sys.stderr)
+        return VariantEntry(
+            name=infer_name_from_url(link),
+            source_url=link,
+            notes=f"Fetch error: {exc}",
+        )
+
+
+def write_variants(variants: Iterable[VariantEntry], out: TextIO) -> int:
+    """Write entries as an indented JSON array, one at a time.
+
+    The output is the same as json.dump of the whole list with indent=2.
+    Returns the number of entries written.
+    """
+    count = 0
+    for entry in variants:
+        out.write(",\n" if count else "[\n")
+        encoded = json.dumps(entry, cls=VariantEncoder, indent=2, ensure_ascii=False)
+        out.write(textwrap.indent(encoded, "  "))
+        count += 1
+    out.write("\n]" if count else "[]")
+    return count
+
+
+def main(output_path: Optional[str] = None, workers: int = FETCH_WORKERS,
+         cache_dir: Optional[Path] = None, rate: Optional[float] = REQUESTS_PER_SECOND,
+         prefer_url_name: bool = False):
+    """Fetch all variants and write them as JSON to output_path (or stdout).
+
+    With cache_dir, pages are kept on disk and only downloaded again when
+    the server reports a change. Requests are limited to rate per second
+    (None for no limit) and to what robots.txt allows. With
+    prefer_url_name, variants are named after their file name when it is a
+    plain name, instead of after the page title.
+    """
+    cache = PageCache(cache_dir) if cache_dir else None
+    try:
+        robots = load_robots(BASE_INDEX)
+        crawl_delay = robots.crawl_delay(USER_AGENT)
+        if crawl_delay:
+            rate = min(rate or math.inf, 1 / float(crawl_delay))
+        limiter = RateLimiter(rate) if rate else None
+
+        if robots.can_fetch(USER_AGENT, BASE_INDEX):
+            print("Fetching index...", file=sys.stderr)
+            index_html = fetch_with_retry(BASE_INDEX, cache=cache, limiter=limiter)
+            links = extract_links(index_html)
+            allowed = [link for link in links if robots.can_fetch(USER_AGENT, link)]
+            if len(allowed) < len(links):
+                print(f"Skipping {len(links) - len(allowed)} links disallowed by robots.txt", file=sys.stderr)
+            links = allowed
+            print(f"Found {len(links)} variant links", file=sys.stderr)
+        else:
+            print("robots.txt disallows the variant index; nothing to fetch", file=sys.stderr)
+            links = []
+
+        # Pages are only held until parsed, and entries are written as they
+        # come in; map keeps them in index order. The parse pool only starts
+        # processes once a large page comes in, from a fetch thread, so they
+        # are started by a forkserver rather than forked from this
+        # multithreaded process (where other threads may hold locks)
+        with ProcessPoolExecutor(mp_context=_PARSE_MP_CONTEXT) as parse_pool, ThreadPoolExecutor(max_workers=workers) as executor:
+            fetch_one = partial(fetch_variant, cache=cache, parse_pool=parse_pool, limiter=limiter,
+                                prefer_url_name=prefer_url_name)
+            variants = executor.map(fetch_one, links)
+            if output_path:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    count = write_variants(variants, f)
+                print(f"Wrote {count} variants to {output_path}", file=sys.stderr)
             else:
-                name = infer_name_from_url(link)
-
-            entry = VariantEntry(
-                name=name,
-                source_url=link,
-                notes=text,
-            )
-            variants.append(entry)
-            print(f"Fetched: {name}", file=sys.stderr)
-        except Exception as exc:  # noqa: BLE001
-            print(f"Failed to fetch {link}: {exc}", file=sys.stderr)
-            entry = VariantEntry(
-                name=infer_name_from_url(link),
-                source_url=link,
-                notes=f"Fetch error: {exc}",
-            )
-            variants.append(entry)
-
-    data = [v.to_dict() for v in variants]
-    out = json.dumps(data, indent=2, ensure_ascii=False)
-    if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(out)
-        print(f"Wrote {len(variants)} variants to {output_path}", file=sys.stderr)
-    else:
-        print(out)
+                write_variants(variants, sys.stdout)
+                print()
+    finally:
+        _POOL.close()
 
 
 if __name__ == "__main__":
-    out_path = sys.argv[1] if len(sys.argv) > 1 else None
-    main(out_path)
+    arg_parser = argparse.ArgumentParser(description="Fetch backgammon variant rules from bkgm.com")
+    arg_parser.add_argument("output", nargs="?", help="JSON file to write (default: stdout)")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help=f"download every page instead of using {DEFAULT_CACHE_DIR}")
+    arg_parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                            help="maximum requests per second (default: %(default)s)")
+    arg_parser.add_argument("--prefer-url-name", action="store_true",
+                            help="name variants after their page's file name when it is a plain name")
+    args = arg_parser.parse_args()
+    main(args.output, cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR, rate=args.rate,
+         prefer_url_name=args.prefer_url_name)
@@ -1,7 +1,12 @@
+import http.client
+import io
 import json
-from types import SimpleNamespace
+import urllib.error
+from contextlib import contextmanager
 from unittest.mock import patch
 
+import pytest
+
 import scripts.fetch_variants as fv
 
 
@@ -19,6 +24,20 @@ def test_extract_links_parses_variant_html_links():
     assert "VariantB.html" in links[1]
 
 
+def test_extract_links_dedups_normalized_urls():
+    html = """
+    <a href="VariantA.html">A</a>
+    <a href="VariantA.html#rules">A rules</a>
+    <a href="./VariantA.html">A again</a>
+    <a href="HTTPS://WWW.BKGM.COM/variants/VariantA.html">A upper</a>
+    <a href="../variants/VariantB.html#top">B</a>
+    """
+    assert fv.extract_links(html) == [
+        "https://www.bkgm.com/variants/VariantA.html",
+        "https://www.bkgm.com/variants/VariantB.html",
+    ]
+
+
 def test_extract_text_strips_scripts_and_styles():
     html = """
     <html>
@@ -45,6 +64,81 @@ def test_infer_name_from_url_titles():
     assert fv.infer_name_from_url("https://www.bkgm.com/variants/Dir/Another_Game.HTML") == "Another Game"
 
 
+class FakeResponse:
+    def __init__(self, data, status=200, headers=None):
+        self.data = data
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = http.client.HTTPMessage()
+        self.headers["Content-Type"] = "text/html; charset=utf-8"
+        for name, value in (headers or {}).items():
+            del self.headers[name]
+            self.headers[name] = value
+
+    def read(self, amt=None):
+        return self.data if amt is None else self.data[:amt]
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class FakeConnection:
+    """Stands in for http.client.HTTPSConnection, answering from serve(url).
+
+    serve returns the page bytes, a FakeResponse, or raises. The headers of
+    every request are recorded in sent.
+    """
+
+    sent = []
+
+    def __init__(self, serve, host, timeout=None):
+        self.serve = serve
+        self.host = host
+        self.url = None
+        # Like http.client, a request whose response was never received
+        # blocks the connection until it is closed
+        self.request_sent = False
+
+    def request(self, method, path, headers=None):
+        if self.request_sent:
+            raise http.client.CannotSendRequest("Request-sent")
+        self.request_sent = True
+        self.url = f"https://{self.host}{path}"
+        self.sent.append((self.url, headers))
+
+    def getresponse(self):
+        result = self.serve(self.url)
+        self.request_sent = False
+        return result if isinstance(result, FakeResponse) else FakeResponse(result)
+
+    def close(self):
+        self.request_sent = False
+
+
+@contextmanager
+def serve_pages(serve):
+    fake = patch(
+        "http.client.HTTPSConnection",
+        side_effect=lambda host, timeout=None: FakeConnection(serve, host, timeout),
+    )
+    FakeConnection.sent.clear()
+    with fake:
+        try:
+            yield
+        finally:
+            # Don't leave fake connections pooled for later tests
+            fv._POOL.close()
+
+
+def test_is_clear_name():
+    assert fv.is_clear_name("Plakoto")
+    assert fv.is_clear_name("Russian Backgammon")
+    assert fv.is_clear_name("Gul Bara")
+    assert not fv.is_clear_name("Var")
+    assert not fv.is_clear_name("Page2")
+    assert not fv.is_clear_name("Acey Deucey.Old")
+
+
 def test_main_builds_json_with_schema(monkeypatch, tmp_path):
     index_html = """
     <html><body>
@@ -57,22 +151,14 @@ def test_main_builds_json_with_schema(monkeypatch, tmp_path):
     <body><p>Some rule text.</p></body></html>
     """
 
-    def fake_urlopen(url):
+    def serve(url):
         if url.endswith("VariantA.html") or url.endswith("VariantB.html"):
-            data = page_html.encode("utf-8")
-        else:
-            data = index_html.encode("utf-8")
-
-        return SimpleNamespace(
-            read=lambda: data,
-            headers=SimpleNamespace(get_content_charset=lambda: "utf-8"),
-            __enter__=lambda self=None: self,
-            __exit__=lambda *args: None,
-        )
+            return page_html.encode("utf-8")
+        return index_html.encode("utf-8")
 
     out_file = tmp_path / "out.json"
-    with patch("urllib.request.urlopen", side_effect=fake_urlopen):
-        fv.main(str(out_file))
+    with serve_pages(serve):
+        fv.main(str(out_file), rate=None)
 
     saved = json.loads(out_file.read_text(encoding="utf-8"))
     assert len(saved) == 2
@@ -94,3 +180,263 @@ def test_main_builds_json_with_schema(monkeypatch, tmp_path):
             "notes",
         ]:
             assert key in entry
+
+
+def test_main_keeps_index_order_and_records_failures(monkeypatch, tmp_path):
+    monkeypatch.setattr(fv.time, "sleep", lambda seconds: None)
+    index_html = "".join(f'<a href="Variant{i}.html">{i}</a>' for i in range(8))
+
+    def serve(url):
+        if url.endswith("Variant3.html"):
+            raise OSError("connection reset")
+        if url.endswith(".html"):
+            name = url.rsplit("/", 1)[-1][:-5]
+            return f"<title>{name}</title><p>{name} rules</p>".encode("utf-8")
+        return index_html.encode("utf-8")
+
+    out_file = tmp_path / "out.json"
+    with serve_pages(serve):
+        fv.main(str(out_file), workers=4, rate=None)
+
+    saved = json.loads(out_file.read_text(encoding="utf-8"))
+    assert [e["source_url"].rsplit("/", 1)[-1] for e in saved] == [f"Variant{i}.html" for i in range(8)]
+    assert saved[0]["notes"] == "Variant0 Variant0 rules"
+    assert saved[3]["name"] == "Variant3"
+    assert saved[3]["notes"].startswith("Fetch error:")
+
+
+def test_fetch_follows_redirects_and_raises_http_errors():
+    def serve(url):
+        if url.endswith("/old.html"):
+            return FakeResponse(b"", status=301, headers={"Location": "new.html"})
+        if url.endswith("/new.html"):
+            return "caf\u00e9".encode("utf-8")
+        return FakeResponse(b"missing", status=404)
+
+    with serve_pages(serve):
+        assert fv.fetch("https://www.bkgm.com/variants/old.html") == "caf\u00e9"
+        with pytest.raises(urllib.error.HTTPError) as err:
+            fv.fetch("https://www.bkgm.com/variants/gone.html")
+    assert err.value.code == 404
+
+
+def test_fetch_with_retry_retries_transient_errors_only(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(fv.time, "sleep", sleeps.append)
+    calls = []
+
+    def serve(url):
+        calls.append(url)
+        if url.endswith("/flaky.html") and len(calls) < 3:
+            if len(calls) == 1:
+                return FakeResponse(b"", status=503)
+            return FakeResponse(b"", status=429, headers={"Retry-After": "2"})
+        if url.endswith("/missing.html"):
+            return FakeResponse(b"", status=404)
+        return b"ok"
+
+    with serve_pages(serve):
+        assert fv.fetch_with_retry("https://www.bkgm.com/variants/flaky.html") == "ok"
+        assert len(calls) == 3
+        assert 0 <= sleeps[0] <= fv.RETRY_BASE_DELAY
+        assert sleeps[1] == 2.0
+
+        calls.clear()
+        with pytest.raises(urllib.error.HTTPError):
+            fv.fetch_with_retry("https://www.bkgm.com/variants/missing.html")
+        assert len(calls) == 1
+
+
+def test_parse_page_returns_title_and_text_in_one_pass():
+    html = """
+    <html><head><title> Plakoto &amp; Portes - Backgammon Variants </title>
+    <script>var t = "<title>x</title>";</script></head>
+    <body><h1>Plakoto</h1><p>Pin instead of hit.</p></body></html>
+    """
+    title, text = fv.parse_page(html)
+    assert title == "Plakoto & Portes - Backgammon Variants"
+    assert text == "Plakoto & Portes - Backgammon Variants Plakoto Pin instead of hit."
+    assert fv.parse_page("<p>No title</p>") == (None, "No title")
+
+
+def test_fetch_caps_page_size(monkeypatch):
+    monkeypatch.setattr(fv, "MAX_PAGE_BYTES", 10)
+
+    def serve(url):
+        if url.endswith("/declared.html"):
+            return FakeResponse(b"x" * 20, headers={"Content-Length": "20"})
+        return b"<p>" + b"y" * 20
+
+    with serve_pages(serve):
+        with pytest.raises(ValueError):
+            fv.fetch("https://www.bkgm.com/variants/declared.html")
+        assert fv.fetch("https://www.bkgm.com/variants/chunked.html") == "<p>yyyyyyy"
+
+
+def test_fetch_rejects_non_html_pages():
+    def serve(url):
+        return FakeResponse(b"%PDF-1.4", headers={"Content-Type": "application/pdf"})
+
+    with serve_pages(serve):
+        with pytest.raises(ValueError, match="application/pdf"):
+            fv.fetch("https://www.bkgm.com/variants/rules.html")
+
+
+def test_fetch_revalidates_cached_pages(tmp_path):
+    cache = fv.PageCache(tmp_path / "cache")
+    url = "https://www.bkgm.com/variants/portes.html"
+
+    def serve(url):
+        headers = FakeConnection.sent[-1][1]
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(b"", status=304)
+        return FakeResponse(b"<p>Portes</p>", headers={"ETag": '"v1"'})
+
+    with serve_pages(serve):
+        assert fv.fetch(url, cache) == "<p>Portes</p>"
+        assert "If-None-Match" not in FakeConnection.sent[0][1]
+        assert fv.fetch(url, cache) == "<p>Portes</p>"
+        assert FakeConnection.sent[1][1]["If-None-Match"] == '"v1"'
+    assert len(list((tmp_path / "cache").glob("*.html"))) == 1
+
+
+def test_main_parses_large_pages_in_process_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(fv, "PARSE_IN_PROCESS_BYTES", 100)
+    big_page = "<title>Big</title>" + "<p>rule</p>" * 20
+
+    def serve(url):
+        if url.endswith("Big.html"):
+            return big_page.encode("utf-8")
+        if url.endswith("Small.html"):
+            return b"<title>Small</title><p>rule</p>"
+        return b'<a href="Big.html">B</a><a href="Small.html">S</a>'
+
+    out_file = tmp_path / "out.json"
+    with serve_pages(serve):
+        fv.main(str(out_file), workers=2, rate=None)
+
+    saved = json.loads(out_file.read_text(encoding="utf-8"))
+    assert [e["name"] for e in saved] == ["Big", "Small"]
+    assert saved[0]["notes"] == "Big " + " ".join(["rule"] * 20)
+
+
+def test_scan_page_matches_parse_page():
+    html = """<!DOCTYPE html><html><head><title> Plakoto &amp; Portes </title>
+    <script>var t = "<title>x</title>";</script><style>p { color: red; }</style></head>
+    <body><!-- <p>hidden</p> --><h1>Plakoto</h1><p>Pin&nbsp;instead of <i>hit</i>.</p>
+    a < b and c > d<br/>end</body></html>"""
+    assert fv.scan_page(html) == fv.parse_page(html)
+    assert fv.scan_page(html)[0] == "Plakoto & Portes"
+    assert fv.scan_page("<p>No title</p>") == (None, "No title")
+
+
+def test_write_variants_matches_json_dump():
+    variants = [
+        fv.VariantEntry(name="Portes", source_url="https://www.bkgm.com/variants/portes.html",
+                        notes="Line one\nLine \u00e9"),
+        fv.VariantEntry(name="Plakoto", source_url="https://www.bkgm.com/variants/plakoto.html"),
+    ]
+    for entries in (variants, []):
+        out = io.StringIO()
+        assert fv.write_variants(iter(entries), out) == len(entries)
+        assert out.getvalue() == json.dumps(entries, cls=fv.VariantEncoder, indent=2, ensure_ascii=False)
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    now = [100.0]
+    sleeps = []
+    monkeypatch.setattr(fv.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(fv.time, "sleep", sleeps.append)
+
+    limiter = fv.RateLimiter(rate=10)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+    now[0] += 10
+    sleeps.clear()
+    limiter.acquire()
+    limiter.pause(1.0)
+    limiter.acquire()
+    assert sleeps == pytest.approx([1.1])
+
+
+def test_main_follows_robots_txt(monkeypatch, tmp_path):
+    limiters = []
+    monkeypatch.setattr(fv, "RateLimiter", lambda rate: limiters.append(rate) or None)
+
+    def serve(url):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(
+                b"User-agent: *\nDisallow: /variants/Private.html\nCrawl-delay: 2\n",
+                headers={"Content-Type": "text/plain"},
+            )
+        if url.endswith("Public.html"):
+            return b"<title>Public</title>"
+        if url.endswith("Private.html"):
+            raise AssertionError("fetched a page disallowed by robots.txt")
+        return b'<a href="Public.html">A</a><a href="Private.html">B</a>'
+
+    out_file = tmp_path / "out.json"
+    with serve_pages(serve):
+        fv.main(str(out_file), rate=None)
+
+    saved = json.loads(out_file.read_text(encoding="utf-8"))
+    assert [e["name"] for e in saved] == ["Public"]
+    assert limiters == [0.5]
+
+
+def test_main_prefers_clear_url_names(tmp_path):
+    def serve(url):
+        if url.endswith(".html"):
+            return b"<title>Rules of the game</title><p>text</p>"
+        return b'<a href="plakoto.html">P</a><a href="v2.html">V</a>'
+
+    out_file = tmp_path / "out.json"
+    with serve_pages(serve):
+        fv.main(str(out_file), rate=None, prefer_url_name=True)
+
+    saved = json.loads(out_file.read_text(encoding="utf-8"))
+    assert [e["name"] for e in saved] == ["Plakoto", "Rules of the game"]
+    assert saved[0]["notes"] == "Rules of the game text"
+
+
+def test_fetch_reconnects_after_timeout(monkeypatch):
+    monkeypatch.setattr(fv.time, "sleep", lambda seconds: None)
+    timeouts = []
+
+    def serve(url):
+        if not timeouts:
+            timeouts.append(url)
+            raise TimeoutError("timed out")
+        return b"<p>ok</p>"
+
+    with serve_pages(serve):
+        with pytest.raises(TimeoutError):
+            fv.fetch("https://www.bkgm.com/variants/a.html")
+        assert fv.fetch("https://www.bkgm.com/variants/b.html") == "<p>ok</p>"
+
+    timeouts.clear()
+    with serve_pages(serve):
+        assert fv.fetch_with_retry("https://www.bkgm.com/variants/a.html") == "<p>ok</p>"
+    assert len(FakeConnection.sent) == 2
+
+
+def test_main_stops_when_robots_txt_disallows_the_index(tmp_path):
+    for robots_response in (
+        lambda url: FakeResponse(b"", status=403),
+        lambda url: (
+            FakeResponse(b"", status=301, headers={"Location": "/robots-moved.txt"})
+            if url.endswith("/robots.txt")
+            else FakeResponse(b"User-agent: *\nDisallow: /\n", headers={"Content-Type": "text/plain"})
+        ),
+    ):
+        def serve(url):
+            if "robots" in url:
+                return robots_response(url)
+            raise AssertionError(f"fetched {url} although robots.txt disallows it")
+
+        out_file = tmp_path / "out.json"
+        with serve_pages(serve):
+            fv.main(str(out_file), rate=None)
+        assert json.loads(out_file.read_text(encoding="utf-8")) == []